@@ -2,7 +2,7 @@
 Core package for multiagenticswarm components.
 """
 
-from .agent import Agent, AgentConfig
+from .agent import Agent, AgentConfig, run_agents_parallel
 from .tool import Tool, ToolConfig, ToolScope, create_logger_tool, create_memory_tool
 from .task import Task, TaskStep, TaskStatus, Collaboration
 from .trigger import Trigger, TriggerType, TriggerStatus
@@ -14,6 +14,7 @@ __all__ = [
     # Agent
     "Agent",
     "AgentConfig",
+    "run_agents_parallel",
     
     # Tool
     "Tool",
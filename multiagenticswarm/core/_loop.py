@@ -0,0 +1,38 @@
+"""
+Event loop helpers shared by the asyncio-heavy components.
+
+uvloop is optional; when it is missing the default asyncio loop is used.
+"""
+
+import asyncio
+import os
+import sys
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def install_uvloop() -> bool:
+    """
+    Make uvloop the event loop policy for loops created from now on.
+
+    Skipped on Windows, when uvloop is not installed, or when the
+    MAS_DISABLE_UVLOOP environment variable is set to "1". Loops that are
+    already running are not affected.
+
+    Returns:
+        True if uvloop is the active event loop policy
+    """
+    if not UVLOOP_AVAILABLE or sys.platform == "win32" or os.environ.get("MAS_DISABLE_UVLOOP") == "1":
+        return False
+    if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.debug("Installed uvloop event loop policy")
+    return True
@@ -0,0 +1,96 @@
+"""
+Coalesced, off-loop progress board writes shared by agents and delegators.
+"""
+
+import asyncio
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+
+class ProgressBatcher:
+    """
+    Coalesce progress board writes from concurrent agents.
+
+    Operations submitted within a short window are applied with one
+    ProgressBoard.apply_batch() call, so the board file is read and written
+    once per batch instead of once per update. All board I/O runs on a
+    single worker thread, keeping the event loop free while preserving the
+    board's serial read/write semantics.
+    """
+
+    def __init__(self, progress_board, max_batch_size: int = 64, max_delay: float = 0.025):
+        # Weak so the per-board registry entry can be dropped with the board
+        self._board_ref = weakref.ref(progress_board)
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="progress-board")
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def run(self, func, *args, **kwargs) -> Any:
+        """Run a blocking board call on the board's worker thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def submit(self, operation: str, **kwargs) -> Dict[str, Any]:
+        """Queue a board operation and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if self._task is None:
+            # The drain task exits once the queue is empty, so each burst of
+            # updates gets a fresh queue bound to the running loop. Enqueue
+            # before creating the task so an eager task factory sees the item.
+            self._queue = asyncio.Queue()
+            self._queue.put_nowait((operation, kwargs, future))
+            self._task = loop.create_task(self._drain())
+        else:
+            self._queue.put_nowait((operation, kwargs, future))
+        return await future
+
+    async def _drain(self) -> None:
+        """Apply queued operations in batches until the queue is empty."""
+        try:
+            while not self._queue.empty():
+                # Let a short window of updates accumulate, then take what is
+                # queued; no per-item get()/timeout tasks are created
+                if self._queue.qsize() < self.max_batch_size:
+                    await asyncio.sleep(self.max_delay)
+                batch = [
+                    self._queue.get_nowait()
+                    for _ in range(min(self._queue.qsize(), self.max_batch_size))
+                ]
+
+                try:
+                    progress_board = self._board_ref()
+                    if progress_board is None:
+                        raise RuntimeError("Progress board no longer exists")
+                    results = await self.run(
+                        progress_board.apply_batch,
+                        [(operation, kwargs) for operation, kwargs, _ in batch]
+                    )
+                except Exception as e:
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for (_, _, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self._task = None
+
+
+# One batcher per board so updates from every agent sharing it coalesce
+_batchers: "weakref.WeakKeyDictionary[Any, ProgressBatcher]" = weakref.WeakKeyDictionary()
+
+
+def get_progress_batcher(progress_board) -> ProgressBatcher:
+    """Get the shared batcher for a progress board."""
+    batcher = _batchers.get(progress_board)
+    if batcher is None:
+        batcher = ProgressBatcher(progress_board)
+        _batchers[progress_board] = batcher
+    return batcher
@@ -0,0 +1,79 @@
+"""
+Serialization helpers with optional fast backends.
+
+Prefers msgspec, then orjson, and falls back to the standard library json
+module when neither is installed. All encoders return bytes.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if MSGSPEC_AVAILABLE:
+    _json_encoder = msgspec.json.Encoder()
+    _json_decoder = msgspec.json.Decoder()
+    _msgpack_encoder = msgspec.msgpack.Encoder()
+    _msgpack_decoder = msgspec.msgpack.Decoder()
+    DECODE_ERRORS = (ValueError, msgspec.DecodeError)
+else:
+    DECODE_ERRORS = (ValueError,)
+
+Buffer = Union[bytes, bytearray, memoryview, str]
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode an object as UTF-8 JSON bytes, optionally indented by two spaces."""
+    if MSGSPEC_AVAILABLE:
+        data = _json_encoder.encode(obj)
+        return msgspec.json.format(data, indent=2) if indent else data
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_str(obj: Any, indent: bool = False) -> str:
+    """Encode an object as a JSON string."""
+    return dumps(obj, indent=indent).decode("utf-8")
+
+
+def loads(data: Buffer) -> Any:
+    """Decode JSON from bytes or str."""
+    if MSGSPEC_AVAILABLE:
+        return _json_decoder.decode(data)
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def packb(obj: Any) -> bytes:
+    """
+    Encode an object for internal checkpoints and IPC.
+
+    Uses MessagePack when msgspec is installed and JSON bytes otherwise, so
+    the output must only be read back with unpackb().
+    """
+    if MSGSPEC_AVAILABLE:
+        return _msgpack_encoder.encode(obj)
+    return dumps(obj)
+
+
+def unpackb(data: Buffer) -> Any:
+    """Decode bytes produced by packb()."""
+    if MSGSPEC_AVAILABLE:
+        return _msgpack_decoder.decode(data)
+    return loads(data)
@@ -2,10 +2,12 @@
 Core agent implementation with LLM provider abstraction.
 """
 
+import asyncio
+import logging
+import sys
 import uuid
 import time
 from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
-import json
 from datetime import datetime
 
 if TYPE_CHECKING:
@@ -32,9 +34,17 @@ except ImportError:
 from ..llm.providers import LLMProvider, get_llm_provider
 from ..utils.logger import get_logger
 from .tool_parser import ToolCallParser
+from . import _serde
 
 logger = get_logger(__name__)
 
+# Read-only empty seed shared across calls; callers that need to mutate
+# must build their own container
+_NO_TOOL_CALLS: tuple = ()
+
+# Stateless; shared by all agents instead of being rebuilt on every execute()
+_tool_call_parser = ToolCallParser()
+
 
 class AgentConfig(BaseModel):
     """Configuration for an agent."""
@@ -57,6 +67,29 @@ class Agent:
     access to a hierarchical tool system (local, shared, global).
     """
     
+    # Core state lives in slots; "__dict__" stays available (and is only
+    # allocated on demand) for subclasses and callers that attach attributes
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "system_prompt",
+        "llm_provider_name",
+        "llm_model",
+        "llm_config",
+        "max_iterations",
+        "memory_enabled",
+        "local_tools",
+        "shared_tools",
+        "global_tools",
+        "memory",
+        "execution_context",
+        "_llm_provider",
+        "_tool_choice",
+        "__dict__",
+        "__weakref__",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -87,7 +120,9 @@ class Agent:
             raise ValueError("Agent name cannot be empty")
             
         self.id = agent_id or str(uuid.uuid4())
-        self.name = name
+        # Interned so name-keyed lookups (tool sharing, executor permissions)
+        # can short-circuit on identity
+        self.name = sys.intern(name)
         self.description = description
         self.system_prompt = system_prompt
         self.llm_provider_name = llm_provider
@@ -106,6 +141,11 @@ class Agent:
         self.execution_context: Dict[str, Any] = {}
         self._llm_provider: Optional[LLMProvider] = None
         
+        # Invariant per-call inputs, built once instead of on every execute()
+        self._tool_choice: Union[str, Dict[str, str]] = (
+            {"type": "auto"} if llm_provider == "anthropic" else "auto"
+        )
+        
         logger.info(f"Created agent '{name}' with {llm_provider}/{llm_model}")
     
     @property
@@ -127,7 +167,7 @@ class Agent:
         self.memory.append({
             "role": role,
             "content": content,
-            "metadata": metadata or {},
+            "metadata": metadata if metadata is not None else {},
             "timestamp": datetime.now().isoformat()
         })
     
@@ -168,15 +208,20 @@ class Agent:
         tool_registry: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Execute a task with standardized tool support."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        name = self.name
+        
+        # Skip building log payloads entirely when INFO is filtered out
+        log_actions = logger.isEnabledFor(logging.INFO)
         
         # Log the agent action start
-        logger.log_agent_action(
-            agent_name=self.name,
-            action="execute",
-            input_data=input_text,
-            context=context
-        )
+        if log_actions:
+            logger.log_agent_action(
+                agent_name=name,
+                action="execute",
+                input_data=input_text,
+                context=context
+            )
         
         try:
             # Add input to memory
@@ -187,15 +232,11 @@ class Agent:
             
             # Handle tool access - support both new tool_executor and legacy available_tools
             if tool_executor:
-                tools_schema = tool_executor.get_tools_schema_for_agent(self.name)
+                tools_schema = tool_executor.get_tools_schema_for_agent(name)
                 if tools_schema:
                     execution_context["tools"] = tools_schema
-                    # Set tool choice based on provider
-                    if self.llm_provider_name == "anthropic":
-                        execution_context["tool_choice"] = {"type": "auto"}
-                    else:
-                        execution_context["tool_choice"] = "auto"
-                    logger.debug(f"Agent {self.name}: Providing {len(tools_schema)} tools to LLM")
+                    execution_context["tool_choice"] = self._tool_choice
+                    logger.debug(f"Agent {name}: Providing {len(tools_schema)} tools to LLM")
             elif available_tools and tool_registry:
                 # Legacy support: create tool schemas from available_tools and tool_registry
                 tools_schemas = []
@@ -208,11 +249,8 @@ class Agent:
                 
                 if tools_schemas:
                     execution_context["tools"] = tools_schemas
-                    if self.llm_provider_name == "anthropic":
-                        execution_context["tool_choice"] = {"type": "auto"}
-                    else:
-                        execution_context["tool_choice"] = "auto"
-                    logger.debug(f"Agent {self.name}: Providing {len(tools_schemas)} legacy tools to LLM")
+                    execution_context["tool_choice"] = self._tool_choice
+                    logger.debug(f"Agent {name}: Providing {len(tools_schemas)} legacy tools to LLM")
             
             # Prepare messages for LLM
             messages = []
@@ -225,33 +263,47 @@ class Agent:
             for msg in self.memory[-10:]:
                 messages.append({"role": msg["role"], "content": msg["content"]})
             
-            # Add tool parser
-            parser = ToolCallParser()
-            
             # Start tool calling loop
             max_iterations = self.max_iterations
             iteration = 0
             final_response = ""
+            log_debug = logger.isEnabledFor(logging.DEBUG)
+            
+            # Resolve the provider and its optional hooks once, not per iteration
+            provider = self.llm_provider
+            extract_native_tool_calls = getattr(provider, 'extract_tool_calls', None)
+            create_tool_response = getattr(provider, 'create_tool_response_for_llm', None)
+            is_anthropic = self.llm_provider_name == "anthropic"
+            
+            # Without an executor or registry any tool call would be dropped,
+            # so the first response is final and parsing can be skipped
+            can_run_tools = bool(tool_executor) or bool(tool_registry and available_tools)
             
             while iteration < max_iterations:
                 iteration += 1
-                logger.debug(f"Agent {self.name}: Tool calling iteration {iteration}")
+                if log_debug:
+                    logger.debug(f"Agent {name}: Tool calling iteration {iteration}")
                 
                 # Execute with LLM provider
-                response = await self.llm_provider.execute(
+                response = await provider.execute(
                     messages=messages,
                     context=execution_context
                 )
                 
+                if not can_run_tools:
+                    final_response = response.content
+                    break
+                
                 # First check if LLM has native tool calling
-                tool_calls = []
-                if hasattr(self.llm_provider, 'extract_tool_calls'):
-                    tool_calls = self.llm_provider.extract_tool_calls(response)
+                tool_calls = _NO_TOOL_CALLS
+                if extract_native_tool_calls is not None:
+                    tool_calls = extract_native_tool_calls(response)
                 
                 # If no native tool calls, parse from response content
                 if not tool_calls and response.content:
-                    tool_calls = parser.extract_tool_calls(response.content)
-                    logger.debug(f"Parsed {len(tool_calls)} tool calls from response content")
+                    tool_calls = _tool_call_parser.extract_tool_calls(response.content)
+                    if log_debug:
+                        logger.debug(f"Parsed {len(tool_calls)} tool calls from response content")
             
                 if not tool_calls:
                     # No tool calls, we're done
@@ -260,10 +312,11 @@ class Agent:
                 
                 # Execute tool calls using standardized executor or legacy tools
                 if tool_executor:
-                    logger.debug(f"Agent {self.name}: Executing {len(tool_calls)} tool calls")
+                    if log_debug:
+                        logger.debug(f"Agent {name}: Executing {len(tool_calls)} tool calls")
                     
                     # Execute all tool calls
-                    tool_responses = await tool_executor.execute_tool_calls(tool_calls, self.name)
+                    tool_responses = await tool_executor.execute_tool_calls(tool_calls, name)
                     
                     # Add assistant message with tool calls to conversation
                     messages.append({
@@ -275,15 +328,15 @@ class Agent:
                                 "type": "function",
                                 "function": {
                                     "name": tc.name,
-                                    "arguments": json.dumps(tc.arguments)
+                                    "arguments": _serde.dumps_str(tc.arguments)
                                 }
                             } for tc in tool_calls
                         ]
                     })
                     
                     # Add tool responses to conversation
-                    if hasattr(self.llm_provider, 'create_tool_response_for_llm'):
-                        tool_messages = self.llm_provider.create_tool_response_for_llm(tool_responses)
+                    if create_tool_response is not None:
+                        tool_messages = create_tool_response(tool_responses)
                         if isinstance(tool_messages, list):
                             messages.extend(tool_messages)
                         else:
@@ -291,7 +344,8 @@ class Agent:
                     
                 elif tool_registry and available_tools:
                     # Legacy tool execution support
-                    logger.debug(f"Agent {self.name}: Executing {len(tool_calls)} tool calls (legacy mode)")
+                    if log_debug:
+                        logger.debug(f"Agent {name}: Executing {len(tool_calls)} tool calls (legacy mode)")
                     
                     # Execute tool calls using legacy tools
                     tool_results = []
@@ -326,7 +380,7 @@ class Agent:
                                 "type": "function", 
                                 "function": {
                                     "name": tc.name,
-                                    "arguments": json.dumps(tc.arguments)
+                                    "arguments": _serde.dumps_str(tc.arguments)
                                 }
                             } for tc in tool_calls
                         ]
@@ -335,14 +389,14 @@ class Agent:
                     # Add tool results to conversation  
                     for result in tool_results:
                         # Check if provider is Anthropic and format accordingly
-                        if self.llm_provider_name == "anthropic":
+                        if is_anthropic:
                             messages.append({
                                 "role": "user",
                                 "content": [
                                     {
                                         "type": "tool_result",
                                         "tool_use_id": result["tool_call_id"],
-                                        "content": json.dumps(result["output"])
+                                        "content": _serde.dumps_str(result["output"])
                                     }
                                 ]
                             })
@@ -350,29 +404,23 @@ class Agent:
                             messages.append({
                                 "role": "tool",
                                 "tool_call_id": result["tool_call_id"],
-                                "content": json.dumps(result["output"])
+                                "content": _serde.dumps_str(result["output"])
                             })
-                
-                else:
-                    # No tool execution available
-                    logger.warning(f"Agent {self.name}: Tool calls requested but no tool executor or registry available")
-                    final_response = response.content
-                    break
             
             # If we ran out of iterations, use the last response
             if iteration >= max_iterations and not final_response:
                 final_response = "Maximum tool calling iterations reached."
-                logger.warning(f"Agent {self.name}: Reached maximum tool calling iterations")
+                logger.warning(f"Agent {name}: Reached maximum tool calling iterations")
             
             # Add final response to memory
             self.add_to_memory("assistant", final_response)
             
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             # Create result
             result = {
                 "agent_id": self.id,
-                "agent_name": self.name,
+                "agent_name": name,
                 "input": input_text,
                 "output": final_response,
                 "tool_calls_made": iteration - 1,
@@ -380,38 +428,42 @@ class Agent:
                 "success": True
             }
             
-            logger.log_agent_action(
-                agent_name=self.name,
-                action="execute_complete",
-                input_data=input_text,
-                output_data=final_response,
-                context={
-                    "execution_time": execution_time,
-                    "tool_iterations": iteration - 1
-                }
-            )
+            if log_actions:
+                logger.log_agent_action(
+                    agent_name=name,
+                    action="execute_complete",
+                    input_data=input_text,
+                    output_data=final_response,
+                    context={
+                        "execution_time": execution_time,
+                        "tool_iterations": iteration - 1
+                    }
+                )
             
             return result
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             
-            logger.log_agent_action(
-                agent_name=self.name,
-                action="execute_error",
-                input_data=input_text,
-                context={
-                    "error": str(e),
-                    "execution_time": execution_time
-                }
-            )
+            error = str(e)
+            
+            if log_actions:
+                logger.log_agent_action(
+                    agent_name=name,
+                    action="execute_error",
+                    input_data=input_text,
+                    context={
+                        "error": error,
+                        "execution_time": execution_time
+                    }
+                )
             
             return {
                 "agent_id": self.id,
-                "agent_name": self.name,
+                "agent_name": name,
                 "input": input_text,
                 "output": "",
-                "error": str(e),
+                "error": error,
                 "execution_time": execution_time,
                 "success": False
             }
@@ -433,6 +485,15 @@ class Agent:
             "global_tools": self.global_tools
         }
     
+    def to_bytes(self) -> bytes:
+        """Encode the agent's dictionary form for checkpointing or IPC."""
+        return _serde.packb(self.to_dict())
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Agent":
+        """Create agent from bytes produced by to_bytes()."""
+        return cls.from_dict(_serde.unpackb(data))
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Agent":
         """Create agent from dictionary representation."""
@@ -462,3 +523,39 @@ class Agent:
     
     def __repr__(self) -> str:
         return f"Agent(name='{self.name}', llm='{self.llm_provider_name}/{self.llm_model}')"
+
+
+async def run_agents_parallel(
+    agents: List[Agent],
+    input_text: str,
+    context: Optional[Dict[str, Any]] = None,
+    max_concurrency: int = 32,
+    **execute_kwargs: Any
+) -> List[Dict[str, Any]]:
+    """
+    Execute several agents on the same input concurrently.
+    
+    LLM calls are I/O bound, so callers that would otherwise await
+    agent.execute() in a loop should use this instead.
+    
+    Args:
+        agents: Agents to run
+        input_text: Input passed to every agent
+        context: Execution context; each agent receives its own shallow copy
+        max_concurrency: Maximum number of agents executing at once
+        **execute_kwargs: Extra keyword arguments forwarded to Agent.execute
+        
+    Returns:
+        Execution results in the same order as ``agents``
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _run(agent: Agent) -> Dict[str, Any]:
+        async with semaphore:
+            return await agent.execute(
+                input_text,
+                context=dict(context) if context else {},
+                **execute_kwargs
+            )
+    
+    return list(await asyncio.gather(*(_run(agent) for agent in agents)))
@@ -2,10 +2,12 @@
 Standardized tool interface following OpenAPI 3.0 and JSON Schema specifications.
 """
 
+import asyncio
 import json
 import uuid
 import time
 import inspect
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union, Callable
 from enum import Enum
@@ -23,6 +25,17 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Shared pool for synchronous FunctionTool callables, created on first use
+_sync_tool_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_sync_tool_executor() -> ThreadPoolExecutor:
+    """Return the shared, bounded pool that runs synchronous tool functions."""
+    global _sync_tool_executor
+    if _sync_tool_executor is None:
+        _sync_tool_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="tool")
+    return _sync_tool_executor
+
 
 @dataclass
 class ToolCallRequest:
@@ -436,10 +449,7 @@ class FunctionTool(BaseTool):
         if inspect.iscoroutinefunction(self.func):
             return await self.func(**kwargs)
         else:
-            # Run synchronous functions in a thread pool to enable concurrency
-            import asyncio
-            import concurrent.futures
-            
-            loop = asyncio.get_event_loop()
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                return await loop.run_in_executor(executor, lambda: self.func(**kwargs))
+            # Run synchronous functions in the shared pool so they never block
+            # the event loop and no pool is spun up per call
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_get_sync_tool_executor(), lambda: self.func(**kwargs))
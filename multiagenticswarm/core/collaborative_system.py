@@ -3,11 +3,18 @@ Enhanced collaborative system with universal agent capabilities and centralized
 """
 
 import asyncio
+import copy
+import functools
 import os
+import re
 import subprocess
-from typing import Any, Dict, List, Optional, Union
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 from pathlib import Path
 
+from . import _loop
+from ._progress_batcher import get_progress_batcher
 from .system import System
 from .agent import Agent
 from .delegation import SimpleDelegator, DelegationStrategy
@@ -16,6 +23,373 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keyword scans used when parsing collaboration prompts. These are plain
+# substring alternations so they match exactly what the old `in` checks did.
+_ROLE_VERB_RE = re.compile(r"focuses|handles|manages|responsible")
+_PHASE_KEYWORD_RE = re.compile(r"setup|development|integration|testing|polish")
+_COORDINATION_KEYWORD_RE = re.compile(r"share|review|coordinate|help|communicate")
+
+# Checked in order; the first focus with a matching keyword wins
+_FOCUS_PATTERNS = {
+    "ui": re.compile(r"ui|user interface|design|screens|widgets", re.IGNORECASE),
+    "audio": re.compile(r"audio|music|playback|streaming|sound", re.IGNORECASE),
+    "data": re.compile(r"data|models|state|storage|database|persistence", re.IGNORECASE),
+}
+
+# Task lists handed to agents by primary focus when delegating from a prompt
+_AGENT_TASK_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+    "ui": (
+        "Implement Material Design 3 theme and styling",
+        "Create main navigation and routing system",
+        "Build home screen with playlist grid",
+        "Design player screen with controls",
+        "Create search screen with filtering",
+        "Implement responsive layout components",
+    ),
+    "audio": (
+        "Create core audio service for playback",
+        "Implement streaming service for online music",
+        "Build offline audio playback system",
+        "Create audio player controls widget",
+        "Implement playlist management audio logic",
+        "Add audio state management and notifications",
+    ),
+    "data": (
+        "Design and implement Track data model",
+        "Create Playlist and User data models",
+        "Setup state management with Provider/Riverpod",
+        "Implement local storage with Hive/SQLite",
+        "Create API integration layer",
+        "Build user preferences and settings management",
+    ),
+}
+
+# Simulated deliverables as (phase name keyword, required agent focus or
+# None for any agent, deliverables), checked in order
+_PHASE_DELIVERABLES: Tuple[Tuple[str, Optional[str], Tuple[str, ...]], ...] = (
+    ("data", "data", ("Track.dart", "Playlist.dart", "UserPreferences.dart", "AppState.dart")),
+    ("audio", "audio", ("AudioService.dart", "StreamingService.dart", "PlayerControls.dart")),
+    ("ui", "ui", ("HomeScreen.dart", "PlayerScreen.dart", "SearchScreen.dart", "AppTheme.dart")),
+    ("integration", None, ("Integration tests", "Code reviews", "Bug fixes")),
+)
+
+# Snippet message phrases and the project file each maps to, checked in order
+# against the lowercased update message by write_code_to_files()
+_FILE_MAPPINGS: Tuple[Tuple[str, str], ...] = tuple(
+    (phrase.lower(), path) for phrase, path in (
+        ("Track data model", "lib/models/track.dart"),
+        ("Playlist data model", "lib/models/playlist.dart"),
+        ("User data model", "lib/models/user.dart"),
+        ("UserPreferences data model", "lib/models/user_preferences.dart"),
+        ("Provider-based state management", "lib/providers/app_providers.dart"),
+        ("AudioProvider state management", "lib/providers/audio_provider.dart"),
+        ("PlaylistProvider state management", "lib/providers/playlist_provider.dart"),
+        ("data services", "lib/services/data_services.dart"),
+        ("local storage system", "lib/services/storage_service.dart"),
+        ("core audio service", "lib/services/audio_service.dart"),
+        ("streaming service", "lib/services/streaming_service.dart"),
+        ("player controls widget", "lib/widgets/player_controls.dart"),
+        ("Material Design 3 theme", "lib/utils/theme.dart"),
+        ("navigation system", "lib/utils/app_router.dart"),
+        ("HomeScreen screen", "lib/screens/home_screen.dart"),
+        ("PlayerScreen screen", "lib/screens/player_screen.dart"),
+        ("SearchScreen screen", "lib/screens/search_screen.dart"),
+        ("PlaylistScreen screen", "lib/screens/playlist_screen.dart"),
+        ("Main application entry point", "lib/main.dart"),
+        ("Complete pubspec.yaml", "pubspec.yaml"),
+    )
+)
+
+# Finds every phrase occurrence in one scan. The lookahead makes matches
+# zero-width so overlapping phrases are all reported; group i + 1 is
+# _FILE_MAPPINGS[i]. No phrase is a prefix of another, so at most one
+# alternative can match at a given position.
+_FILE_MAPPING_RE = re.compile(
+    "(?=" + "|".join(f"({re.escape(phrase)})" for phrase, _ in _FILE_MAPPINGS) + ")"
+)
+
+
+def _freeze(tree: Dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap a nested dict in read-only mapping proxies."""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in tree.items()
+    })
+
+
+def _thaw(tree: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy a frozen nested mapping back into plain, JSON-encodable dicts."""
+    return {
+        key: _thaw(value) if isinstance(value, Mapping) else value
+        for key, value in tree.items()
+    }
+
+
+# Layout of the generated Flutter app; _generate_flutter_structure() hands
+# out plain copies of this template
+_FLUTTER_PROJECT_STRUCTURE = _freeze({
+    "lib/": {
+        "main.dart": "App entry point",
+        "screens/": {
+            "home_screen.dart": "Main music browser",
+            "player_screen.dart": "Now playing screen",
+            "playlist_screen.dart": "Playlist management",
+            "search_screen.dart": "Search interface"
+        },
+        "widgets/": {
+            "player_controls.dart": "Play/pause/skip controls",
+            "track_list_tile.dart": "Track display widget",
+            "mini_player.dart": "Bottom mini player"
+        },
+        "services/": {
+            "audio_service.dart": "Audio playback logic",
+            "streaming_service.dart": "Music streaming",
+            "offline_service.dart": "Offline playback"
+        },
+        "models/": {
+            "track.dart": "Track data model",
+            "playlist.dart": "Playlist model",
+            "user_preferences.dart": "User settings"
+        },
+        "providers/": {
+            "audio_provider.dart": "Audio state management",
+            "playlist_provider.dart": "Playlist state",
+            "user_provider.dart": "User data state"
+        },
+        "utils/": {
+            "constants.dart": "App constants",
+            "theme.dart": "Material Design 3 theme"
+        }
+    },
+    "pubspec.yaml": "Dependencies and project config",
+    "README.md": "Project documentation"
+})
+
+
+# Static part of every UniversalAgent system prompt; only the collaboration
+# prompt varies, and it is usually shared by every agent in a system
+_COLLABORATION_TEMPLATE = """
+
+COLLABORATION CAPABILITIES:
+You are a collaborative agent with access to these universal capabilities:
+
+COLLABORATION PROMPT:
+{collaboration_prompt}
+
+PROGRESS TRACKING:
+- Use report_progress(task, percentage, details) to report your current task progress
+- Post status updates with post_update() to keep team informed
+- Track time estimates and actual time spent on tasks
+
+PROJECT ANALYSIS:
+- Analyze current project state and identify what needs to be done next
+- Assess dependencies between tasks and evaluate overall project health
+- Read and interpret collaboration prompts to understand your role
+
+TEAM COORDINATION:
+- Read updates from other agents with read_updates()
+- Share insights and coordinate work with coordinate_with_team()
+- Request help when needed with request_help()
+- Respond to help requests from team members
+- Follow collaboration instructions from the project configuration
+
+CODE COLLABORATION:
+- Share interface definitions early with share_interface()
+- Share code snippets with share_code_snippet()
+- Review each other's code and provide feedback
+- Coordinate on shared dependencies
+
+COMMUNICATION RULES:
+- All communication happens through the progress board (no direct agent-to-agent messaging)
+- Post meaningful status updates regularly
+- Be responsive to help requests
+- Share knowledge and collaborate actively
+- Follow the collaboration prompt guidelines for your role
+
+Always read the collaboration prompt at the start of any task to understand:
+1. Your specific role and responsibilities
+2. How to coordinate with other agents
+3. The collaboration style to follow
+4. Dependencies and sequencing requirements
+
+Remember: You're part of a team working toward a common goal. Collaborate actively and help your teammates succeed.
+"""
+
+
+@functools.lru_cache(maxsize=4)
+def _prompt_lines(collaboration_prompt: str) -> Tuple[str, ...]:
+    """Split a collaboration prompt into its stripped, non-empty lines."""
+    return tuple(line for line in (raw.strip() for raw in collaboration_prompt.splitlines()) if line)
+
+
+@functools.lru_cache(maxsize=32)
+def _collaboration_instructions(collaboration_prompt: str) -> str:
+    """Render the collaboration instructions for a collaboration prompt."""
+    return _COLLABORATION_TEMPLATE.format(collaboration_prompt=collaboration_prompt)
+
+
+@functools.lru_cache(maxsize=128)
+def _default_agent_tasks(main_task: str) -> Tuple[str, ...]:
+    """Tasks for an agent whose focus has no template."""
+    return (
+        f"Contribute to {main_task} based on collaboration prompt",
+        "Coordinate with team members",
+        "Review and integrate with other components",
+    )
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_text_files(
+    files: List[Tuple[Path, str]],
+    atomic: bool = False
+) -> List[Optional[Exception]]:
+    """
+    Write a batch of UTF-8 text files in one call.
+
+    Meant to be run on a worker thread so a whole batch costs one hand-off
+    from the event loop. Files are written with raw os-level calls, skipping
+    the buffered file object set-up that open() does per file.
+
+    Args:
+        files: (path, content) pairs; parent directories are created
+        atomic: Write to a temporary file and rename it into place
+
+    Returns:
+        None for each file written, or the exception that prevented it
+    """
+    errors: List[Optional[Exception]] = []
+    # Files usually share a handful of directories; create each one once
+    created_dirs = set()
+    for path, content in files:
+        try:
+            parent = path.parent
+            if parent not in created_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(parent)
+            target = path.with_suffix(path.suffix + ".tmp") if atomic else path
+            data = memoryview(content.encode("utf-8"))
+            fd = os.open(target, _WRITE_FLAGS, 0o666)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+            if atomic:
+                os.replace(target, path)
+            errors.append(None)
+        except Exception as e:
+            errors.append(e)
+    return errors
+
+
+def _build_phase_dag(phases: List[Dict[str, Any]]) -> Dict[int, List[int]]:
+    """
+    Map each phase index to the indices of the phases it depends on.
+
+    Raises:
+        ValueError: If a phase depends on an unknown phase or on a name that
+            several phases share, or the dependencies form a cycle
+    """
+    # Unnamed phases can't be depended on, so only named ones are indexed.
+    # Phases parsed from a prompt may share a name; that is only an error
+    # when some depends_on entry refers to it.
+    indices: Dict[str, int] = {}
+    duplicates = set()
+    for index, phase in enumerate(phases):
+        name = phase.get("name")
+        if name is None:
+            continue
+        if name in indices:
+            duplicates.add(name)
+        indices[name] = index
+
+    dag: Dict[int, List[int]] = {}
+    for index, phase in enumerate(phases):
+        if "depends_on" not in phase:
+            dag[index] = [index - 1] if index else []
+            continue
+        deps = []
+        for name in phase["depends_on"]:
+            if name not in indices:
+                raise ValueError(f"Phase '{phase.get('name')}' depends on unknown phase '{name}'")
+            if name in duplicates:
+                raise ValueError(f"Phase '{phase.get('name')}' depends on duplicate phase name '{name}'")
+            deps.append(indices[name])
+        dag[index] = deps
+
+    # Kahn's algorithm; anything left unvisited is on a cycle
+    pending = {index: len(deps) for index, deps in dag.items()}
+    ready = [index for index, count in pending.items() if count == 0]
+    visited = 0
+    while ready:
+        current = ready.pop()
+        visited += 1
+        for index, deps in dag.items():
+            if current in deps:
+                pending[index] -= deps.count(current)
+                if pending[index] == 0:
+                    ready.append(index)
+    if visited != len(dag):
+        raise ValueError("Phase dependencies contain a cycle")
+
+    return dag
+
+
+# Python 3.12+; called per task rather than installed on the loop
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+
+def _start_task(coro) -> "asyncio.Task[Any]":
+    """
+    Start one of the library's own tasks, eagerly on Python 3.12+.
+
+    An eager task runs its coroutine up to the first suspension inside this
+    call, so agent work that finishes without suspending skips a loop
+    iteration. The loop's task factory is never changed, so the host
+    application's tasks keep their normal start order.
+    """
+    loop = asyncio.get_running_loop()
+    if _eager_task_factory is not None:
+        return _eager_task_factory(loop, coro)
+    return loop.create_task(coro)
+
+
+class _ProgressEvents:
+    """
+    Bounded queue of agent progress events.
+
+    The asyncio.Queue is created on first use inside the running loop, not
+    when the system is built, since on Python 3.9 a queue binds to the loop
+    current at creation. A new loop (e.g. a second asyncio.run()) gets a
+    fresh queue.
+    """
+
+    def __init__(self, maxsize: int = 1000):
+        self.maxsize = maxsize
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+
+    def _get_queue(self) -> asyncio.Queue:
+        """Get the queue for the running loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._loop = loop
+        return self._queue
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        """Push a progress event, dropping the oldest one if nobody is consuming."""
+        events = self._get_queue()
+        if events.full():
+            events.get_nowait()
+        events.put_nowait(event)
+
+    async def get(self) -> Dict[str, Any]:
+        """Wait for the next progress event."""
+        return await self._get_queue().get()
+
 
 class UniversalAgent(Agent):
     """
@@ -28,6 +402,16 @@ class UniversalAgent(Agent):
     - Collaboration prompt awareness
     """
 
+    # Agent keeps "__dict__" in its slots, so subclasses may still add attributes
+    __slots__ = (
+        "progress_board",
+        "current_task",
+        "task_progress",
+        "collaboration_prompt",
+        "_roster",
+        "_progress_events",
+    )
+
     def __init__(
         self,
         name: str,
@@ -70,68 +454,47 @@ class UniversalAgent(Agent):
         self.current_task = None
         self.task_progress = 0
         self.collaboration_prompt = collaboration_prompt
-        self.team_members = []
+        # Names of everyone on the team, self included. CollaborativeSystem
+        # shares its agent registry here so joining agents need no fan-out.
+        self._roster = ()
+        # Set by CollaborativeSystem so progress is pushed to listeners
+        self._progress_events: Optional[_ProgressEvents] = None
 
         logger.info(f"Created UniversalAgent '{name}' with collaboration capabilities")
 
     def _create_enhanced_system_prompt(self, original_prompt: str, description: str, collaboration_prompt: str = "") -> str:
         """Create enhanced system prompt with collaboration instructions."""
-        collaboration_instructions = f"""
-
-COLLABORATION CAPABILITIES:
-You are a collaborative agent with access to these universal capabilities:
-
-COLLABORATION PROMPT:
-{collaboration_prompt}
-
-PROGRESS TRACKING:
-- Use report_progress(task, percentage, details) to report your current task progress
-- Post status updates with post_update() to keep team informed
-- Track time estimates and actual time spent on tasks
-
-PROJECT ANALYSIS:
-- Analyze current project state and identify what needs to be done next
-- Assess dependencies between tasks and evaluate overall project health
-- Read and interpret collaboration prompts to understand your role
-
-TEAM COORDINATION:
-- Read updates from other agents with read_updates()
-- Share insights and coordinate work with coordinate_with_team()
-- Request help when needed with request_help()
-- Respond to help requests from team members
-- Follow collaboration instructions from the project configuration
-
-CODE COLLABORATION:
-- Share interface definitions early with share_interface()
-- Share code snippets with share_code_snippet()
-- Review each other's code and provide feedback
-- Coordinate on shared dependencies
-
-COMMUNICATION RULES:
-- All communication happens through the progress board (no direct agent-to-agent messaging)
-- Post meaningful status updates regularly
-- Be responsive to help requests
-- Share knowledge and collaborate actively
-- Follow the collaboration prompt guidelines for your role
-
-Always read the collaboration prompt at the start of any task to understand:
-1. Your specific role and responsibilities
-2. How to coordinate with other agents
-3. The collaboration style to follow
-4. Dependencies and sequencing requirements
-
-Remember: You're part of a team working toward a common goal. Collaborate actively and help your teammates succeed.
-"""
-
-        return f"{original_prompt}\n{collaboration_instructions}"
+        # Interned so agents with identical prompts share one string
+        return sys.intern(f"{original_prompt}\n{_collaboration_instructions(collaboration_prompt)}")
 
     def set_progress_board(self, progress_board):
         """Set the progress board for collaboration."""
         self.progress_board = progress_board
 
+    @property
+    def team_members(self) -> List[str]:
+        """Names of the other agents on the team."""
+        return [member for member in self._roster if member != self.name]
+
+    @team_members.setter
+    def team_members(self, team_members: List[str]) -> None:
+        self._roster = list(team_members)
+
     def set_team_members(self, team_members: List[str]):
         """Set list of team member agent names."""
-        self.team_members = [member for member in team_members if member != self.name]
+        self.team_members = team_members
+
+    async def _submit_to_board(self, operation: str, **kwargs) -> Dict[str, Any]:
+        """Send a write operation to the progress board through its batcher."""
+        batcher = get_progress_batcher(self.progress_board)
+        if not hasattr(self.progress_board, "apply_batch"):
+            return await batcher.run(getattr(self.progress_board, operation), **kwargs)
+        return await batcher.submit(operation, **kwargs)
+
+    async def _read_board(self, operation: str, **kwargs) -> Dict[str, Any]:
+        """Run a read-only progress board call off the event loop."""
+        batcher = get_progress_batcher(self.progress_board)
+        return await batcher.run(getattr(self.progress_board, operation), **kwargs)
 
     async def report_progress(
         self,
@@ -155,8 +518,16 @@ Remember: You're part of a team working toward a common goal. Collaborate active
         self.current_task = task
         self.task_progress = percentage
 
+        if self._progress_events is not None:
+            self._progress_events.publish({
+                "agent": self.name,
+                "task": task,
+                "percentage": percentage
+            })
+
         if self.progress_board:
-            return self.progress_board.report_progress(
+            return await self._submit_to_board(
+                "report_progress",
                 agent_name=self.name,
                 task=task,
                 percentage=percentage,
@@ -178,9 +549,17 @@ Remember: You're part of a team working toward a common goal. Collaborate active
             return {"error": "No progress board available for analysis"}
 
         # Get project status and collaboration prompt
-        project_status = self.progress_board.get_project_status()
-        prompt_info = self.progress_board.get_collaboration_prompt()
-        recent_activity = self.progress_board.get_recent_activity(hours=24)
+        if hasattr(self.progress_board, "get_analysis_snapshot"):
+            snapshot = await self._read_board("get_analysis_snapshot", hours=24)
+            project_status = snapshot["project_status"]
+            prompt_info = snapshot["prompt_info"]
+            recent_activity = snapshot["recent_activity"]
+        else:
+            project_status, prompt_info, recent_activity = await asyncio.gather(
+                self._read_board("get_project_status"),
+                self._read_board("get_collaboration_prompt"),
+                self._read_board("get_recent_activity", hours=24)
+            )
 
         # Analyze team activity
         team_analysis = {
@@ -218,21 +597,25 @@ Remember: You're part of a team working toward a common goal. Collaborate active
         if not collaboration_prompt:
             return None
 
-        lines = collaboration_prompt.split('\n')
-        for line in lines:
-            if self.name.lower() in line.lower() or any(keyword in self.name.lower() for keyword in ["ui", "audio", "data"]):
+        name_lower = self.name.lower()
+        # Independent of the line, so every line matches when this is set
+        name_has_role_keyword = any(keyword in name_lower for keyword in ("ui", "audio", "data"))
+
+        for line in _prompt_lines(collaboration_prompt):
+            line_lower = line.lower()
+            if name_has_role_keyword or name_lower in line_lower:
                 # Extract role description
                 if ":" in line:
                     return line.split(":", 1)[1].strip()
-                elif any(verb in line.lower() for verb in ["focuses", "handles", "manages", "responsible"]):
+                elif _ROLE_VERB_RE.search(line_lower):
                     return line.strip()
 
         # Fallback: parse based on agent name
-        if "ui" in self.name.lower():
+        if "ui" in name_lower:
             return "UI/UX and app navigation development"
-        elif "audio" in self.name.lower():
+        elif "audio" in name_lower:
             return "Audio playback and music features"
-        elif "data" in self.name.lower():
+        elif "data" in name_lower:
             return "Data models and state management"
         else:
             return "General development support"
@@ -256,7 +639,10 @@ Remember: You're part of a team working toward a common goal. Collaborate active
             needs_attention.append("Some agents appear inactive - may need coordination")
 
         # Check for help requests
-        if any("help_request" in str(activity) for activity in recent_activity.get("recent_updates", [])):
+        if any(
+            activity.get("type") == "help_request"
+            for activity in recent_activity.get("recent_updates", ())
+        ):
             needs_attention.append("There are pending help requests")
 
         return needs_attention
@@ -279,7 +665,8 @@ Remember: You're part of a team working toward a common goal. Collaborate active
             Coordination result
         """
         if self.progress_board:
-            return self.progress_board.coordinate_with_team(
+            return await self._submit_to_board(
+                "coordinate_with_team",
                 agent_name=self.name,
                 message=message,
                 coordination_type=coordination_type,
@@ -309,7 +696,8 @@ Remember: You're part of a team working toward a common goal. Collaborate active
             Help request result
         """
         if self.progress_board:
-            return self.progress_board.request_help(
+            return await self._submit_to_board(
+                "request_help",
                 agent_name=self.name,
                 topic=topic,
                 details=details,
@@ -322,7 +710,7 @@ Remember: You're part of a team working toward a common goal. Collaborate active
 
     async def respond_to_help(
         self,
-        help_request_id: str,
+        help_request_id: Union[int, str],
         response: str,
         code_snippet: Optional[str] = None,
         additional_resources: Optional[List[str]] = None
@@ -331,7 +719,8 @@ Remember: You're part of a team working toward a common goal. Collaborate active
         Respond to a help request from another agent.
 
         Args:
-            help_request_id: ID of the help request to respond to
+            help_request_id: ID of the help request to respond to, as returned
+                by request_help (numeric strings are also accepted)
             response: Response message
             code_snippet: Optional code snippet to help
             additional_resources: Optional list of additional resources
@@ -340,9 +729,12 @@ Remember: You're part of a team working toward a common goal. Collaborate active
             Response result
         """
         if self.progress_board:
-            return self.progress_board.respond_to_help(
+            if not isinstance(help_request_id, int):
+                help_request_id = int(help_request_id)
+            return await self._submit_to_board(
+                "respond_to_help",
                 agent_name=self.name,
-                request_id=int(help_request_id),
+                request_id=help_request_id,
                 response=response,
                 code_provided=code_snippet is not None
             )
@@ -360,7 +752,7 @@ Remember: You're part of a team working toward a common goal. Collaborate active
         if not self.progress_board:
             return {"error": "No progress board available"}
 
-        prompt_info = self.progress_board.get_collaboration_prompt()
+        prompt_info = await self._read_board("get_collaboration_prompt")
 
         if prompt_info["has_prompt"]:
             collaboration_prompt = prompt_info["collaboration_prompt"]
@@ -399,7 +791,8 @@ Remember: You're part of a team working toward a common goal. Collaborate active
             Interface sharing result
         """
         if self.progress_board:
-            return self.progress_board.share_interface(
+            return await self._submit_to_board(
+                "share_interface",
                 agent_name=self.name,
                 interface_name=interface_name,
                 methods=methods,
@@ -429,7 +822,8 @@ Remember: You're part of a team working toward a common goal. Collaborate active
             Code sharing result
         """
         if self.progress_board:
-            return self.progress_board.share_code_snippet(
+            return await self._submit_to_board(
+                "share_code_snippet",
                 agent_name=self.name,
                 snippet=snippet,
                 description=description,
@@ -456,15 +850,10 @@ Remember: You're part of a team working toward a common goal. Collaborate active
             Team updates
         """
         if self.progress_board:
-            # Get recent activity
-            activity = self.progress_board.get_recent_activity(hours=hours)
-
-            # Filter by agent if specified
+            # Filter at the board so other agents' activity is never collected
+            activity = await self._read_board("get_recent_activity", hours=hours, agent_filter=agent_filter)
             if agent_filter:
-                filtered_activity = {
-                    agent_filter: activity["agent_activity"].get(agent_filter, [])
-                }
-                activity["agent_activity"] = filtered_activity
+                activity["agent_activity"].setdefault(agent_filter, [])
 
             return activity
         else:
@@ -474,7 +863,7 @@ Remember: You're part of a team working toward a common goal. Collaborate active
     async def get_project_status(self) -> Dict[str, Any]:
         """Get current project status from progress board."""
         if self.progress_board:
-            return self.progress_board.get_project_status()
+            return await self._read_board("get_project_status")
         else:
             return {
                 "overall_progress": 0,
@@ -501,7 +890,8 @@ class CollaborativeSystem(System):
         workspace_dir: str = ".",
         config_path: Optional[str] = None,
         enable_logging: bool = True,
-        verbose: bool = False
+        verbose: bool = False,
+        use_uvloop: bool = False
     ):
         """
         Initialize collaborative system.
@@ -512,16 +902,20 @@ class CollaborativeSystem(System):
             config_path: Configuration file path
             enable_logging: Enable logging
             verbose: Verbose logging
+            use_uvloop: Make uvloop the process-wide event loop policy, if
+                installed, for loops created afterwards
         """
+        if use_uvloop:
+            _loop.install_uvloop()
+
         super().__init__(config_path=config_path, enable_logging=enable_logging, verbose=verbose)
 
-        # Create progress board
+        # Create progress board (it also creates the workspace directory)
         self.workspace_dir = Path(workspace_dir)
-        self.workspace_dir.mkdir(exist_ok=True)
 
         self.progress_board = create_progress_board_tool(
             board_file="progress_board.json",
-            workspace_dir=str(self.workspace_dir)
+            workspace_dir=self.workspace_dir
         )
 
         # Register progress board as global tool
@@ -538,6 +932,13 @@ class CollaborativeSystem(System):
         # Track universal agents
         self.universal_agents: Dict[str, UniversalAgent] = {}
 
+        # (prompt, agent names) and the analysis last derived from them
+        self._prompt_analysis_cache: Optional[Tuple[Tuple[str, Tuple[str, ...]], Dict[str, Any]]] = None
+
+        # Progress reports pushed by agents, so callers can await progress
+        # instead of polling the board
+        self.progress_events = _ProgressEvents(maxsize=1000)
+
         logger.info(f"CollaborativeSystem initialized with workspace: {workspace_dir}")
 
     def set_collaboration_prompt(self, prompt: str) -> Dict[str, Any]:
@@ -550,6 +951,7 @@ class CollaborativeSystem(System):
         Returns:
             Success confirmation
         """
+        self.collaboration_prompt = prompt
         return self.progress_board.set_collaboration_prompt(prompt)
 
     def get_collaboration_prompt(self) -> Dict[str, Any]:
@@ -586,10 +988,9 @@ class CollaborativeSystem(System):
         self.register_agent(universal_agent)
         self.universal_agents[universal_agent.name] = universal_agent
 
-        # Update team member lists for all agents
-        agent_names = list(self.universal_agents.keys())
-        for agent_name, universal_agent_ref in self.universal_agents.items():
-            universal_agent_ref.set_team_members(agent_names)
+        # Team membership is read live from the shared registry
+        universal_agent._roster = self.universal_agents
+        universal_agent._progress_events = self.progress_events
 
         logger.info(f"Added UniversalAgent '{universal_agent.name}' to collaborative system")
 
@@ -598,6 +999,24 @@ class CollaborativeSystem(System):
         for agent in agents:
             self.add_agent(agent)
 
+    async def wait_for_progress(self) -> Dict[str, Any]:
+        """
+        Wait for the next progress report from any agent.
+
+        Returns:
+            Event with the reporting agent, task and percentage
+        """
+        return await self.progress_events.get()
+
+    async def _post_update(self, **kwargs) -> Dict[str, Any]:
+        """
+        Post a system update through the board's batcher.
+
+        Updates posted while agents are also writing are applied together
+        with theirs in one board read and write, off the event loop.
+        """
+        return await get_progress_batcher(self.progress_board).submit("post_update", **kwargs)
+
     async def execute_collaborative_task(
         self,
         task: str,
@@ -634,9 +1053,9 @@ class CollaborativeSystem(System):
         logger.info(f"Starting collaborative task: {task[:100]}...")
         logger.info(f"Using {delegation_strategy} delegation with {len(agent_names)} agents")
 
-        # Create delegator if not already created
-        if self.delegator is None:
-            current_prompt = self.get_collaboration_prompt().get("collaboration_prompt", "")
+        # Reuse the delegator until the collaboration prompt changes
+        current_prompt = self.collaboration_prompt
+        if self.delegator is None or self.delegator.collaboration_prompt != current_prompt:
             self.delegator = SimpleDelegator(
                 strategy=delegation_strategy,
                 collaboration_prompt=current_prompt,
@@ -652,7 +1071,7 @@ class CollaborativeSystem(System):
         )
 
         # Post task start to progress board
-        self.progress_board.post_update(
+        await self._post_update(
             agent_name="CollaborativeSystem",
             message=f"Collaborative task started: {task[:50]}...",
             update_type="task_start",
@@ -690,8 +1109,8 @@ class CollaborativeSystem(System):
         """
         logger.info("Delegating tasks based on collaboration prompt")
 
-        # Store the collaboration prompt
-        self.set_collaboration_prompt(collaboration_prompt)
+        # The board copy is written together with the delegation update below
+        self.collaboration_prompt = collaboration_prompt
 
         # Parse collaboration prompt to extract structure
         prompt_analysis = await self._analyze_collaboration_prompt(collaboration_prompt)
@@ -713,14 +1132,20 @@ class CollaborativeSystem(System):
             agent_tasks = self._generate_agent_tasks(agent_name, role_info, main_task)
             delegation["assignments"][agent_name] = agent_tasks
 
-        # Post delegation information to progress board
-        self.progress_board.post_update(
-            agent_name="CollaborativeSystem",
-            message=f"Task delegation completed based on collaboration prompt",
-            task="task_delegation",
-            progress=100,
-            update_type="coordination",
-            tags=["delegation", "prompt-based", f"phases:{len(delegation['phases'])}", f"agents:{len(delegation['assignments'])}"]
+        # Store the prompt and post the delegation through the board's
+        # batcher, so both land in order with any in-flight agent writes
+        batcher = get_progress_batcher(self.progress_board)
+        await asyncio.gather(
+            batcher.submit("set_collaboration_prompt", prompt=collaboration_prompt),
+            batcher.submit(
+                "post_update",
+                agent_name="CollaborativeSystem",
+                message="Task delegation completed based on collaboration prompt",
+                task="task_delegation",
+                progress=100,
+                update_type="coordination",
+                tags=["delegation", "prompt-based", f"phases:{len(delegation['phases'])}", f"agents:{len(delegation['assignments'])}"]
+            )
         )
 
         return delegation
@@ -735,70 +1160,71 @@ class CollaborativeSystem(System):
         Returns:
             Structured analysis of the prompt
         """
+        # The analysis only depends on the prompt text and the agent names,
+        # so repeated delegations with both unchanged reuse the last result
+        cache_key = (collaboration_prompt, tuple(self.universal_agents))
+        if self._prompt_analysis_cache is not None and self._prompt_analysis_cache[0] == cache_key:
+            return copy.deepcopy(self._prompt_analysis_cache[1])
+
         # Extract agent roles from prompt
         agent_roles = {}
         phases = []
         coordination_rules = []
 
         # Parse the prompt text to identify agent responsibilities
-        lines = collaboration_prompt.strip().split('\n')
         current_section = None
         current_phase = None
+        agent_names = list(self.universal_agents)
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        for line in _prompt_lines(collaboration_prompt):
+            line_lower = line.lower()
 
             # Look for agent definitions
-            for agent_name in self.universal_agents.keys():
-                if agent_name in line and ("focuses" in line or "handles" in line or "manages" in line or "responsible" in line):
-                    # Extract role description
-                    role_desc = line.split(agent_name)[-1].strip()
-                    if role_desc.startswith(("focuses", "handles", "manages")):
-                        agent_roles[agent_name] = {
-                            "description": role_desc,
-                            "responsibilities": [],
-                            "primary_focus": self._extract_primary_focus(role_desc)
-                        }
+            if _ROLE_VERB_RE.search(line):
+                for agent_name in agent_names:
+                    if agent_name in line:
+                        # Extract role description
+                        role_desc = line.rsplit(agent_name, 1)[-1].strip()
+                        if role_desc.startswith(("focuses", "handles", "manages")):
+                            agent_roles[agent_name] = {
+                                "description": role_desc,
+                                "responsibilities": [],
+                                "primary_focus": self._extract_primary_focus(role_desc)
+                            }
 
             # Look for development phases
-            if "phase" in line.lower() or line.strip().endswith(":"):
-                if any(keyword in line.lower() for keyword in ["setup", "development", "integration", "testing", "polish"]):
+            if "phase" in line_lower or line.endswith(":"):
+                if _PHASE_KEYWORD_RE.search(line_lower):
                     phase_info = {
                         "name": line.rstrip(":"),
                         "type": "sequential",  # Default
-                        "agents": list(self.universal_agents.keys()),
+                        "agents": list(agent_names),
                         "description": line
                     }
                     phases.append(phase_info)
                     current_phase = phase_info
 
             # Look for coordination rules
-            if line.startswith(("-", "•", "*")) and any(keyword in line.lower() for keyword in ["share", "review", "coordinate", "help", "communicate"]):
+            if line.startswith(("-", "•", "*")) and _COORDINATION_KEYWORD_RE.search(line_lower):
                 coordination_rules.append(line.lstrip("-•* "))
 
         # If no explicit phases found, create default phases based on agent roles
         if not phases:
             phases = self._create_default_phases(agent_roles)
 
-        return {
+        analysis = {
             "agent_roles": agent_roles,
             "phases": phases,
             "coordination_rules": coordination_rules
         }
+        # Callers get their own copy so they can mutate it freely
+        self._prompt_analysis_cache = (cache_key, copy.deepcopy(analysis))
+        return analysis
 
     def _extract_primary_focus(self, role_description: str) -> str:
         """Extract primary focus area from role description."""
-        focus_keywords = {
-            "ui": ["ui", "user interface", "design", "screens", "widgets"],
-            "audio": ["audio", "music", "playback", "streaming", "sound"],
-            "data": ["data", "models", "state", "storage", "database", "persistence"]
-        }
-
-        role_lower = role_description.lower()
-        for focus, keywords in focus_keywords.items():
-            if any(keyword in role_lower for keyword in keywords):
+        for focus, pattern in _FOCUS_PATTERNS.items():
+            if pattern.search(role_description):
                 return focus
 
         return "general"
@@ -807,40 +1233,50 @@ class CollaborativeSystem(System):
         """Create default development phases based on agent roles."""
         phases = []
 
+        # Group agents by primary focus in one pass over the roles
+        agents_by_focus: Dict[Any, List[str]] = {"data": [], "audio": [], "ui": []}
+        for name, role in agent_roles.items():
+            agents_by_focus.setdefault(role.get("primary_focus"), []).append(name)
+
         # Phase 1: Architecture and Setup (Data first)
-        data_agents = [name for name, role in agent_roles.items() if role.get("primary_focus") == "data"]
+        data_agents = agents_by_focus["data"]
         if data_agents:
             phases.append({
                 "name": "Phase 1: Data Architecture & Setup",
                 "type": "sequential",
+                "depends_on": [],
                 "agents": data_agents,
                 "description": "Setup data models, state management, and storage"
             })
 
         # Phase 2: Core Services (Audio/Backend)
-        service_agents = [name for name, role in agent_roles.items() if role.get("primary_focus") == "audio"]
+        service_agents = agents_by_focus["audio"]
         if service_agents:
             phases.append({
                 "name": "Phase 2: Core Services & Audio",
                 "type": "sequential",
+                "depends_on": [],
                 "agents": service_agents,
                 "description": "Implement core services and audio functionality"
             })
 
         # Phase 3: User Interface
-        ui_agents = [name for name, role in agent_roles.items() if role.get("primary_focus") == "ui"]
+        ui_agents = agents_by_focus["ui"]
         if ui_agents:
             phases.append({
                 "name": "Phase 3: User Interface",
                 "type": "sequential",
+                "depends_on": [],
                 "agents": ui_agents,
                 "description": "Build user interface and navigation"
             })
 
-        # Phase 4: Integration (All agents)
+        # Phase 4: Integration (All agents) waits for every earlier phase;
+        # phases 1-3 only share interfaces through the board and can overlap
         phases.append({
             "name": "Phase 4: Integration & Testing",
             "type": "collaborative",
+            "depends_on": [phase["name"] for phase in phases],
             "agents": list(agent_roles.keys()),
             "description": "Integrate components and test the complete application"
         })
@@ -851,38 +1287,72 @@ class CollaborativeSystem(System):
         """Generate specific tasks for an agent based on their role."""
         primary_focus = role_info.get("primary_focus", "general")
 
-        task_templates = {
-            "ui": [
-                "Implement Material Design 3 theme and styling",
-                "Create main navigation and routing system",
-                "Build home screen with playlist grid",
-                "Design player screen with controls",
-                "Create search screen with filtering",
-                "Implement responsive layout components"
-            ],
-            "audio": [
-                "Create core audio service for playback",
-                "Implement streaming service for online music",
-                "Build offline audio playback system",
-                "Create audio player controls widget",
-                "Implement playlist management audio logic",
-                "Add audio state management and notifications"
-            ],
-            "data": [
-                "Design and implement Track data model",
-                "Create Playlist and User data models",
-                "Setup state management with Provider/Riverpod",
-                "Implement local storage with Hive/SQLite",
-                "Create API integration layer",
-                "Build user preferences and settings management"
-            ]
-        }
+        templates = _AGENT_TASK_TEMPLATES.get(primary_focus)
+        if templates is None:
+            templates = _default_agent_tasks(main_task)
+        return list(templates)
+
+    async def execute_collaboration_phases(
+        self,
+        phases: List[Dict[str, Any]],
+        main_task: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Execute phases in dependency order, overlapping independent ones.
+
+        A phase may list the names of the phases it needs in "depends_on".
+        Phases without that key depend on the phase before them, so plain
+        phase lists still run one after another.
+
+        Args:
+            phases: Phase definitions, as produced by delegate_tasks_from_prompt()
+            main_task: Main task context
+
+        Returns:
+            Phase results keyed by phase name; unnamed phases, and repeats of
+            a name already used, are keyed "phase_<index>"
+        """
+        dependencies = _build_phase_dag(phases)
+        dependents: Dict[int, List[int]] = {index: [] for index in dependencies}
+        for index, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].append(index)
+
+        remaining = {index: len(deps) for index, deps in dependencies.items()}
+        running: Dict[asyncio.Task, int] = {}
+        finished: Dict[int, Dict[str, Any]] = {}
+
+        def _start(index: int) -> None:
+            task = _start_task(self.execute_collaboration_phase(phases[index], main_task))
+            running[task] = index
 
-        return task_templates.get(primary_focus, [
-            f"Contribute to {main_task} based on collaboration prompt",
-            "Coordinate with team members",
-            "Review and integrate with other components"
-        ])
+        for index, count in remaining.items():
+            if count == 0:
+                _start(index)
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = running.pop(task)
+                    finished[index] = task.result()
+                    # Start each dependent as soon as its last dependency finishes
+                    for dependent in dependents[index]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            _start(dependent)
+        finally:
+            for task in running:
+                task.cancel()
+
+        # Report in phase order rather than completion order
+        results: Dict[str, Dict[str, Any]] = {}
+        for index in sorted(finished):
+            name = phases[index].get("name")
+            if name is None or name in results:
+                name = f"phase_{index}"
+            results[name] = finished[index]
+        return results
 
     async def execute_collaboration_phase(
         self,
@@ -904,19 +1374,23 @@ class CollaborativeSystem(System):
         phase_agents = phase.get("agents", [])
         phase_description = phase.get("description", "")
 
+        task_slug = phase_name.lower().replace(" ", "_")
+
         logger.info(f"Executing collaboration phase: {phase_name}")
 
         # Post phase start to progress board
-        self.progress_board.post_update(
+        await self._post_update(
             agent_name="CollaborativeSystem",
             message=f"Starting {phase_name}",
-            task=phase_name.lower().replace(" ", "_"),
+            task=task_slug,
             progress=0,
             update_type="phase_start",
             tags=["collaboration", phase_type, f"agents:{len(phase_agents)}"]
         )
 
         results = {}
+        # Counted as results arrive for the completion update
+        total_deliverables = 0
 
         # Execute based on phase type
         if phase_type == "sequential":
@@ -926,34 +1400,53 @@ class CollaborativeSystem(System):
                     agent = self.universal_agents[agent_name]
                     result = await self._execute_agent_phase_work(agent, phase, main_task)
                     results[agent_name] = result
+                    total_deliverables += len(result.get("deliverables", []))
 
         elif phase_type == "parallel":
-            # Execute all agents simultaneously
-            tasks = []
-            for agent_name in phase_agents:
-                if agent_name in self.universal_agents:
-                    agent = self.universal_agents[agent_name]
-                    tasks.append(self._execute_agent_phase_work(agent, phase, main_task))
+            # Execute all agents simultaneously, handling each result as it lands
+            async def _tagged(name: str, coro):
+                try:
+                    return name, await coro
+                except Exception as e:
+                    return name, e
+
+            tasks = [
+                _start_task(_tagged(agent_name, self._execute_agent_phase_work(
+                    self.universal_agents[agent_name], phase, main_task
+                )))
+                for agent_name in phase_agents
+                if agent_name in self.universal_agents
+            ]
 
-            # Wait for all to complete
-            if tasks:
-                agent_results = await asyncio.gather(*tasks, return_exceptions=True)
-                for i, agent_name in enumerate(phase_agents):
-                    if i < len(agent_results):
-                        results[agent_name] = agent_results[i]
+            for next_result in asyncio.as_completed(tasks):
+                agent_name, result = await next_result
+                results[agent_name] = result
+                if isinstance(result, Exception):
+                    continue
+                total_deliverables += len(result.get("deliverables", []))
+                await self._post_update(
+                    agent_name="CollaborativeSystem",
+                    message=f"{agent_name} finished {phase_name}",
+                    task=task_slug,
+                    progress=100,
+                    update_type="agent_complete",
+                    tags=["collaboration", phase_type, agent_name]
+                )
 
         elif phase_type == "collaborative":
             # All agents work together with coordination
             results = await self._execute_collaborative_phase_work(phase_agents, phase, main_task)
+            for result in results.values():
+                total_deliverables += len(result.get("deliverables", []))
 
         # Post phase completion
-        self.progress_board.post_update(
+        await self._post_update(
             agent_name="CollaborativeSystem",
             message=f"Completed {phase_name}",
-            task=phase_name.lower().replace(" ", "_"),
+            task=task_slug,
             progress=100,
             update_type="phase_complete",
-            tags=["collaboration", "completed", f"deliverables:{sum(len(result.get('deliverables', [])) for result in results.values())}"]
+            tags=["collaboration", "completed", f"deliverables:{total_deliverables}"]
         )
 
         return results
@@ -983,15 +1476,11 @@ class CollaborativeSystem(System):
 
         # Simulate agent work based on their focus and the phase
         deliverables = []
-
-        if "data" in phase_name.lower() and agent_focus == "data":
-            deliverables = ["Track.dart", "Playlist.dart", "UserPreferences.dart", "AppState.dart"]
-        elif "audio" in phase_name.lower() and agent_focus == "audio":
-            deliverables = ["AudioService.dart", "StreamingService.dart", "PlayerControls.dart"]
-        elif "ui" in phase_name.lower() and agent_focus == "ui":
-            deliverables = ["HomeScreen.dart", "PlayerScreen.dart", "SearchScreen.dart", "AppTheme.dart"]
-        elif "integration" in phase_name.lower():
-            deliverables = ["Integration tests", "Code reviews", "Bug fixes"]
+        phase_name_lower = phase_name.lower()
+        for keyword, focus, items in _PHASE_DELIVERABLES:
+            if keyword in phase_name_lower and (focus is None or agent_focus == focus):
+                deliverables = list(items)
+                break
 
         # Report progress
         await agent.report_progress(
@@ -1016,12 +1505,19 @@ class CollaborativeSystem(System):
         """Execute collaborative work where all agents work together."""
         results = {}
 
-        # All agents coordinate and work together
-        for agent_name in agent_names:
-            if agent_name in self.universal_agents:
-                agent = self.universal_agents[agent_name]
-                result = await self._execute_agent_phase_work(agent, phase, main_task)
-                results[agent_name] = result
+        # All agents coordinate and work together, concurrently
+        names = [name for name in agent_names if name in self.universal_agents]
+        gathered = await asyncio.gather(
+            *(_start_task(self._execute_agent_phase_work(self.universal_agents[name], phase, main_task))
+              for name in names),
+            return_exceptions=True
+        )
+
+        for agent_name, result in zip(names, gathered):
+            if isinstance(result, Exception):
+                logger.error(f"Agent {agent_name} failed in collaborative phase: {result}")
+                result = {"status": "error", "error": str(result)}
+            results[agent_name] = result
 
         return results
 
@@ -1032,9 +1528,10 @@ class CollaborativeSystem(System):
         Returns:
             Compiled project deliverables
         """
-        # Get all updates that contain code or deliverables
-        updates_result = self.progress_board.read_updates(limit=1000)
-        all_updates = updates_result.get("updates", [])
+        # Read the board once, on its worker thread; updates, interfaces and
+        # reports all come from it
+        board_data = await get_progress_batcher(self.progress_board).run(self.progress_board.get_board_data)
+        all_updates = board_data.get("updates", [])[-1000:]
 
         # Organize by type
         deliverables = {
@@ -1046,28 +1543,39 @@ class CollaborativeSystem(System):
             "files_created": []
         }
 
-        # Extract code snippets
+        # Extract code snippets, contributing agents and the Flutter tag in one pass
+        code_snippets = deliverables["code_snippets"]
+        contributing_agents = set()
+        has_flutter = False
         for update in all_updates:
             if update.get("code_snippet"):
-                deliverables["code_snippets"].append({
-                    "agent": update.get("agent_name"),
+                agent_name = update.get("agent_name")
+                contributing_agents.add(agent_name)
+                code_snippets.append({
+                    "agent": agent_name,
                     "file_path": update.get("file_path"),
                     "code": update.get("code_snippet"),
                     "description": update.get("message"),
                     "language": update.get("language", "dart"),
                     "timestamp": update.get("timestamp")
                 })
+            if not has_flutter:
+                for tag in update.get("tags", ()):
+                    if "flutter" in tag:
+                        has_flutter = True
+                        break
 
         # Get shared interfaces
-        board_data = self.progress_board._load_board()
         deliverables["interfaces"] = list(board_data.get("interfaces", {}).values())
 
         # Get progress reports
-        deliverables["progress_reports"] = board_data.get("progress_reports", [])
+        deliverables["progress_reports"] = list(board_data.get("progress_reports", []))
 
         # Generate project structure for Flutter app and CREATE ACTUAL FILES
-        if any("flutter" in tag for update in all_updates for tag in update.get("tags", [])):
-            deliverables["project_structure"] = self._generate_flutter_structure(deliverables)
+        if has_flutter:
+            deliverables["project_structure"] = self._generate_flutter_structure(
+                deliverables, contributing_agents
+            )
             # Actually create the Flutter project files
             created_files = await self._create_flutter_project_files(deliverables["code_snippets"])
             deliverables["files_created"] = created_files
@@ -1099,7 +1607,8 @@ class CollaborativeSystem(System):
         for subdir in subdirs:
             (lib_dir / subdir).mkdir(exist_ok=True)
 
-        # Process each code snippet and create files
+        # Resolve target paths, then write every file in one batch off the loop
+        targets = []
         for snippet in code_snippets:
             file_path = snippet.get("file_path")
             code_content = snippet.get("code")
@@ -1116,28 +1625,31 @@ class CollaborativeSystem(System):
                 # Default to lib directory
                 full_path = lib_dir / file_path
 
-            # Ensure directory exists
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write the file
-            try:
-                with open(full_path, 'w', encoding='utf-8') as f:
-                    f.write(code_content)
-
-                created_files.append(str(full_path))
-                logger.info(f"Created Flutter file: {full_path}")
+            targets.append((file_path, full_path, code_content))
 
-                # Also log to progress board
-                self.progress_board.post_update(
-                    agent_name="CollaborativeSystem",
-                    message=f"Created file: {file_path}",
-                    update_type="file_created",
-                    file_path=str(full_path),
-                    tags=["file_creation", "flutter"]
-                )
+        write_results = await asyncio.to_thread(
+            _write_text_files,
+            [(full_path, code_content) for _, full_path, code_content in targets]
+        )
 
-            except Exception as e:
-                logger.error(f"Error creating file {full_path}: {e}")
+        written = []
+        for (file_path, full_path, _), error in zip(targets, write_results):
+            if error is not None:
+                logger.error(f"Error creating file {full_path}: {error}")
+                continue
+            created_files.append(str(full_path))
+            written.append(file_path)
+            logger.info(f"Created Flutter file: {full_path}")
+
+        # One progress board entry for the whole batch
+        if written:
+            await self._post_update(
+                agent_name="CollaborativeSystem",
+                message=f"Created {len(written)} files: {', '.join(written)}",
+                update_type="file_created",
+                file_path=str(flutter_project_dir),
+                tags=["file_creation", "flutter"]
+            )
 
         # Create additional Flutter project files
         await self._create_additional_flutter_files(flutter_project_dir)
@@ -1189,12 +1701,6 @@ All code in this project was generated by AI agents making real LLM calls to Ant
 The agents collaborated through a centralized progress board to coordinate development.
 """
 
-        try:
-            with open(project_dir / "README.md", 'w', encoding='utf-8') as f:
-                f.write(readme_content)
-        except Exception as e:
-            logger.error(f"Error creating README.md: {e}")
-
         # Create .gitignore
         gitignore_content = """# Flutter/Dart specific
 .dart_tool/
@@ -1235,77 +1741,59 @@ Thumbs.db
 *.box
 """
 
-        try:
-            with open(project_dir / ".gitignore", 'w', encoding='utf-8') as f:
-                f.write(gitignore_content)
-        except Exception as e:
-            logger.error(f"Error creating .gitignore: {e}")
-
-    def _generate_flutter_structure(self, deliverables: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate Flutter project structure from deliverables."""
-        structure = {
-            "flutter_music_app/": {
-                "lib/": {
-                    "main.dart": "App entry point",
-                    "screens/": {
-                        "home_screen.dart": "Main music browser",
-                        "player_screen.dart": "Now playing screen",
-                        "playlist_screen.dart": "Playlist management",
-                        "search_screen.dart": "Search interface"
-                    },
-                    "widgets/": {
-                        "player_controls.dart": "Play/pause/skip controls",
-                        "track_list_tile.dart": "Track display widget",
-                        "mini_player.dart": "Bottom mini player"
-                    },
-                    "services/": {
-                        "audio_service.dart": "Audio playback logic",
-                        "streaming_service.dart": "Music streaming",
-                        "offline_service.dart": "Offline playback"
-                    },
-                    "models/": {
-                        "track.dart": "Track data model",
-                        "playlist.dart": "Playlist model",
-                        "user_preferences.dart": "User settings"
-                    },
-                    "providers/": {
-                        "audio_provider.dart": "Audio state management",
-                        "playlist_provider.dart": "Playlist state",
-                        "user_provider.dart": "User data state"
-                    },
-                    "utils/": {
-                        "constants.dart": "App constants",
-                        "theme.dart": "Material Design 3 theme"
-                    }
-                },
-                "pubspec.yaml": "Dependencies and project config",
-                "README.md": "Project documentation"
-            }
-        }
+        # Write both files in one hand-off to a worker thread
+        files = [
+            (project_dir / "README.md", readme_content),
+            (project_dir / ".gitignore", gitignore_content),
+        ]
+        errors = await asyncio.to_thread(_write_text_files, files)
+        for (path, _), error in zip(files, errors):
+            if error is not None:
+                logger.error(f"Error creating {path.name}: {error}")
+
+    def _generate_flutter_structure(
+        self,
+        deliverables: Dict[str, Any],
+        contributing_agents: Optional[set] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate Flutter project structure from deliverables.
+
+        Args:
+            deliverables: Compiled deliverables
+            contributing_agents: Agents that shared code, if already known
 
+        Returns:
+            Project structure with a summary
+        """
         # Add file counts based on deliverables
         code_count = len(deliverables.get("code_snippets", []))
         interface_count = len(deliverables.get("interfaces", []))
-
-        structure["summary"] = {
-            "total_files": self._count_files_in_structure(structure["flutter_music_app/"]),
-            "code_snippets_shared": code_count,
-            "interfaces_defined": interface_count,
-            "agents_contributed": len(set(
+        if contributing_agents is None:
+            contributing_agents = {
                 snippet["agent"] for snippet in deliverables.get("code_snippets", [])
-            ))
-        }
+            }
 
-        return structure
+        return {
+            "flutter_music_app/": _thaw(_FLUTTER_PROJECT_STRUCTURE),
+            "summary": {
+                "total_files": self._count_files_in_structure(_FLUTTER_PROJECT_STRUCTURE),
+                "code_snippets_shared": code_count,
+                "interfaces_defined": interface_count,
+                "agents_contributed": len(contributing_agents)
+            }
+        }
 
-    def _count_files_in_structure(self, structure: Dict[str, Any]) -> int:
+    def _count_files_in_structure(self, structure: Mapping[str, Any]) -> int:
         """Count files in project structure."""
         count = 0
-        for key, value in structure.items():
-            if isinstance(value, dict):
-                count += self._count_files_in_structure(value)
-            else:
-                count += 1
+        stack = [structure]
+        while stack:
+            for value in stack.pop().values():
+                if isinstance(value, Mapping):
+                    stack.append(value)
+                else:
+                    count += 1
         return count
 
     async def create_flutter_project(self, project_name: str = "flutter_music_app") -> str:
@@ -1396,32 +1884,9 @@ flutter:
 
         logger.info(f"Found {len(code_updates)} code snippets to write to files")
 
-        # Map messages to likely file paths
-        file_mappings = {
-            "Track data model": "lib/models/track.dart",
-            "Playlist data model": "lib/models/playlist.dart",
-            "User data model": "lib/models/user.dart",
-            "UserPreferences data model": "lib/models/user_preferences.dart",
-            "Provider-based state management": "lib/providers/app_providers.dart",
-            "AudioProvider state management": "lib/providers/audio_provider.dart",
-            "PlaylistProvider state management": "lib/providers/playlist_provider.dart",
-            "data services": "lib/services/data_services.dart",
-            "local storage system": "lib/services/storage_service.dart",
-            "core audio service": "lib/services/audio_service.dart",
-            "streaming service": "lib/services/streaming_service.dart",
-            "player controls widget": "lib/widgets/player_controls.dart",
-            "Material Design 3 theme": "lib/utils/theme.dart",
-            "navigation system": "lib/utils/app_router.dart",
-            "HomeScreen screen": "lib/screens/home_screen.dart",
-            "PlayerScreen screen": "lib/screens/player_screen.dart",
-            "SearchScreen screen": "lib/screens/search_screen.dart",
-            "PlaylistScreen screen": "lib/screens/playlist_screen.dart",
-            "Main application entry point": "lib/main.dart",
-            "Complete pubspec.yaml": "pubspec.yaml"
-        }
-
         project_dir = self.workspace_dir / "flutter_music_app"
         processed_files = set()
+        pending_writes: List[Tuple[Path, str]] = []
 
         def _validate_and_resolve_file_path(raw_path):
             """Validate and normalise file paths, enforce extensions, and prevent unsafe writes."""
@@ -1456,16 +1921,17 @@ flutter:
             if not code_snippet or not message:
                 continue
 
-            # Find matching file path
+            # Find matching file path; the earliest phrase in the table wins
             file_path = None
-            for key, path in file_mappings.items():
-                if key.lower() in message.lower():
-                    try:
-                        file_path = _validate_and_resolve_file_path(path)
-                    except ValueError as e:
-                        logger.error(str(e))
-                        continue
-                    break
+            mapping_index = min(
+                (match.lastindex for match in _FILE_MAPPING_RE.finditer(message.lower())),
+                default=None
+            )
+            if mapping_index is not None:
+                try:
+                    file_path = _validate_and_resolve_file_path(_FILE_MAPPINGS[mapping_index - 1][1])
+                except ValueError as e:
+                    logger.error(str(e))
 
             if not file_path:
                 # Try to extract from file_path field if available
@@ -1483,22 +1949,17 @@ flutter:
             if str(file_path) in processed_files:
                 continue
 
-            try:
-                # Create directory if needed
-                file_path.parent.mkdir(parents=True, exist_ok=True)
+            processed_files.add(str(file_path))
+            pending_writes.append((file_path, code_snippet))
 
-                # Atomic write
-                tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
-                with open(tmp_path, 'w', encoding='utf-8') as f:
-                    f.write(code_snippet)
-                tmp_path.replace(file_path)
-
-                created_files.append(str(file_path))
-                processed_files.add(str(file_path))
-                logger.info(f"Created file: {file_path}")
-
-            except Exception as e:
-                logger.error(f"Error writing to {file_path}: {e}")
+        # Atomic writes, submitted as one batch to a worker thread
+        write_errors = await asyncio.to_thread(_write_text_files, pending_writes, True)
+        for (file_path, _), error in zip(pending_writes, write_errors):
+            if error is not None:
+                logger.error(f"Error writing to {file_path}: {error}")
+                continue
+            created_files.append(str(file_path))
+            logger.info(f"Created file: {file_path}")
 
         return created_files
 
@@ -1528,7 +1989,7 @@ flutter:
         results = await self.execute_collaborative_task(task, delegation_strategy)
 
         # Write generated code to actual Flutter files
-        progress_data = self.progress_board.get_board_data()
+        progress_data = await get_progress_batcher(self.progress_board).run(self.progress_board.get_board_data)
         created_files = await self.write_code_to_files(progress_data)
 
         # Update results with file creation info
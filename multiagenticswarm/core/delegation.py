@@ -2,13 +2,149 @@
 Simple delegation strategies for multi-agent collaboration.
 """
 
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import functools
+import logging
+import re
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 from enum import Enum
 
+from ._progress_batcher import get_progress_batcher
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keywords used when reading agent roles out of a collaboration prompt
+_ROLE_VERBS = ("focuses on", "handles", "manages")
+_ROLE_ORDER = ("UI", "Audio", "Data")
+_KEYWORD_ROLES = {
+    "ui": "UI", "interface": "UI",
+    "audio": "Audio", "music": "Audio", "playback": "Audio",
+    "data": "Data", "state": "Data", "model": "Data",
+}
+
+# Plain substring matches, like the `in` checks they replace. The lookahead
+# keeps matches zero-width so keywords that overlap ("dataudio") are all seen.
+_PROMPT_ROLE_RE = re.compile("(?=(" + "|".join(_KEYWORD_ROLES) + "))")
+# Agent names only hint at roles through a subset of the keywords
+_AGENT_ROLE_RE = re.compile("(?=(ui|interface|audio|music|data|state))")
+
+# Capabilities and focus area an agent offers for each role
+_ROLE_CAPABILITIES = {
+    "UI": (("UI Development", "Widget Creation", "Navigation"), "User Interface"),
+    "Audio": (("Audio Playback", "Music Controls", "Streaming"), "Audio Features"),
+    "Data": (("Data Models", "State Management", "Storage"), "Data Management"),
+}
+
+# Role keywords that tie agents to the breakdown subtasks; parsed roles
+# (UI/Audio/Data) lowercase to exactly these
+_SUBTASK_KEYWORDS = ("ui", "audio", "data")
+
+# Static Flutter app breakdown; every call copies these and fills in agents
+_FLUTTER_SUBTASKS: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({
+        "id": 1,
+        "name": "UI Development",
+        "description": "Create user interface screens and widgets",
+        "assigned_agent": None,
+        "dependencies": (),
+        "estimated_hours": 8,
+        "components": ("screens", "widgets", "navigation")
+    }),
+    MappingProxyType({
+        "id": 2,
+        "name": "Audio Features",
+        "description": "Implement audio playback and controls",
+        "assigned_agent": None,
+        "dependencies": (),
+        "estimated_hours": 6,
+        "components": ("audio_service", "player_controls", "streaming")
+    }),
+    MappingProxyType({
+        "id": 3,
+        "name": "Data Management",
+        "description": "Create data models and state management",
+        "assigned_agent": None,
+        "dependencies": (),
+        "estimated_hours": 4,
+        "components": ("models", "providers", "storage")
+    }),
+    MappingProxyType({
+        "id": 4,
+        "name": "Integration & Testing",
+        "description": "Integrate components and test app",
+        "assigned_agent": None,
+        "dependencies": (1, 2, 3),
+        "estimated_hours": 3,
+        "components": ("integration", "testing", "debugging")
+    })
+)
+
+# ui/audio/data keywords found in each subtask name, in _FLUTTER_SUBTASKS order
+_FLUTTER_SUBTASK_KEYWORDS = tuple(
+    [keyword for keyword in _SUBTASK_KEYWORDS if keyword in subtask["name"].lower()]
+    for subtask in _FLUTTER_SUBTASKS
+)
+
+
+def _first_indexed_agent(index: Dict[str, Tuple[int, str]], keywords: List[str]) -> Optional[str]:
+    """Return the earliest-listed agent indexed under any of the keywords."""
+    matches = [index[keyword] for keyword in keywords if keyword in index]
+    return min(matches)[1] if matches else None
+
+
+def _find_roles(pattern: "re.Pattern[str]", text: str) -> List[str]:
+    """Return the roles whose keywords occur in lowercased text, in UI/Audio/Data order."""
+    found = {_KEYWORD_ROLES[match.group(1)] for match in pattern.finditer(text)}
+    return [role for role in _ROLE_ORDER if role in found]
+
+
+@functools.lru_cache(maxsize=512)
+def _proposal_fields(agent: str, flutter_music_task: bool) -> Tuple[str, Tuple[str, ...], Tuple[str, ...], str]:
+    """
+    Work out what an agent proposes from its name.
+
+    The result only depends on the agent name and whether the task is a
+    Flutter music app, so it is cached across delegations and rounds.
+
+    Returns:
+        Contribution, capabilities, focus areas and estimated time
+    """
+    # Analyze agent name/role for capabilities
+    capabilities = []
+    focus_areas = []
+
+    agent_lower = agent.lower()
+    for role in _find_roles(_AGENT_ROLE_RE, agent_lower):
+        role_capabilities, focus_area = _ROLE_CAPABILITIES[role]
+        capabilities.extend(role_capabilities)
+        focus_areas.append(focus_area)
+
+    if not capabilities:  # Generic agent
+        capabilities = ["General Development", "Code Review", "Testing"]
+        focus_areas.append("General Support")
+
+    # Create contribution proposal
+    if flutter_music_task:
+        if "ui" in agent_lower:
+            contribution = "I'll handle the Flutter UI - screens, widgets, navigation, and user interface design using Material Design 3"
+            estimated_time = "6-8 hours"
+        elif "audio" in agent_lower:
+            contribution = "I'll implement audio playback features - music player controls, streaming service, and audio state management"
+            estimated_time = "5-7 hours"
+        elif "data" in agent_lower:
+            contribution = "I'll create data models, state management providers, and handle app data persistence"
+            estimated_time = "4-6 hours"
+        else:
+            contribution = f"I'll provide {focus_areas[0].lower()} support and help with integration and testing"
+            estimated_time = "3-5 hours"
+    else:
+        contribution = f"I can contribute {', '.join(capabilities).lower()} to support the main task"
+        estimated_time = "4-6 hours"
+
+    return contribution, tuple(capabilities), tuple(focus_areas), estimated_time
+
 
 class DelegationStrategy(str, Enum):
     """Delegation strategy types."""
@@ -40,6 +176,15 @@ class SimpleDelegator:
         self.collaboration_prompt = collaboration_prompt
         self.progress_board = progress_board
         self.logger = get_logger(f"{__name__}.SimpleDelegator")
+        # Strategy dispatch; every handler takes (main_task, agents, lead_agent,
+        # collaboration_prompt)
+        self._handlers = {
+            DelegationStrategy.HIERARCHICAL: self._hierarchical_delegation,
+            DelegationStrategy.AUTONOMOUS: lambda main_task, agents, lead_agent, prompt:
+                self._autonomous_delegation(main_task, agents, prompt),
+            DelegationStrategy.COLLABORATIVE: lambda main_task, agents, lead_agent, prompt:
+                self._collaborative_delegation(main_task, agents, prompt),
+        }
 
     async def delegate_task(
         self,
@@ -62,17 +207,41 @@ class SimpleDelegator:
         """
         used_strategy = strategy or self.strategy
 
-        self.logger.info(f"Delegating task using {used_strategy} strategy to {len(agents)} agents")
+        # Only format log messages when INFO would actually be emitted
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Delegating task using {used_strategy} strategy to {len(agents)} agents")
 
         # Delegate based on strategy
-        if used_strategy == DelegationStrategy.HIERARCHICAL:
-            return await self._hierarchical_delegation(main_task, agents, lead_agent, self.collaboration_prompt)
-        elif used_strategy == DelegationStrategy.AUTONOMOUS:
-            return await self._autonomous_delegation(main_task, agents, self.collaboration_prompt)
-        elif used_strategy == DelegationStrategy.COLLABORATIVE:
-            return await self._collaborative_delegation(main_task, agents, self.collaboration_prompt)
-        else:
-            raise ValueError(f"Unknown delegation strategy: {used_strategy}")
+        try:
+            handler = self._handlers[DelegationStrategy(used_strategy)]
+        except ValueError:
+            raise ValueError(f"Unknown delegation strategy: {used_strategy}") from None
+        return await handler(main_task, agents, lead_agent, self.collaboration_prompt)
+
+    async def _post_batch(self, operations: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Post board operations through the board's batcher.
+
+        They are applied in order on the board's worker thread, together with
+        any agent writes already queued, so the event loop never waits on
+        board I/O. Boards without apply_batch() get the operations one at a
+        time on the same thread.
+
+        Args:
+            operations: (function name, keyword arguments) pairs
+
+        Returns:
+            One result per operation, in order
+        """
+        batcher = get_progress_batcher(self.progress_board)
+        if hasattr(self.progress_board, "apply_batch"):
+            return list(await asyncio.gather(*(
+                batcher.submit(operation, **kwargs) for operation, kwargs in operations
+            )))
+        return [
+            await batcher.run(getattr(self.progress_board, operation), **kwargs)
+            for operation, kwargs in operations
+        ]
 
     async def _hierarchical_delegation(
         self,
@@ -97,14 +266,6 @@ class SimpleDelegator:
         lead = lead_agent or agents[0]
         subordinates = [a for a in agents if a != lead]
 
-        # Post delegation start
-        self.progress_board.post_update(
-            agent_name="SimpleDelegator",
-            message=f"Starting hierarchical delegation with lead: {lead}",
-            update_type="delegation_start",
-            tags=["delegation", "hierarchical"]
-        )
-
         # Lead agent analyzes task and collaboration prompt
         delegation_plan = {
             "strategy": "hierarchical",
@@ -116,26 +277,41 @@ class SimpleDelegator:
             "coordination_method": "lead_directed"
         }
 
-        # Post delegation plan
-        self.progress_board.post_update(
-            agent_name=lead,
-            message=f"Lead agent analyzing task: {main_task[:100]}...",
-            update_type="task_analysis",
-            tags=["analysis", "lead"]
+        # Post delegation start and the lead's analysis with one board write
+        await self._post_batch([
+            ("post_update", {
+                "agent_name": "SimpleDelegator",
+                "message": f"Starting hierarchical delegation with lead: {lead}",
+                "update_type": "delegation_start",
+                "tags": ["delegation", "hierarchical"]
+            }),
+            ("post_update", {
+                "agent_name": lead,
+                "message": f"Lead agent analyzing task: {main_task[:100]}...",
+                "update_type": "task_analysis",
+                "tags": ["analysis", "lead"]
+            })
+        ])
+
+        # Parse roles from collaboration prompt once for the breakdown and the plan
+        role_assignments = (
+            self._parse_collaboration_roles(collaboration_prompt, agents)
+            if collaboration_prompt else None
         )
 
         # In a real implementation, the lead agent would use LLM to break down tasks
         # For now, we create a basic structure
-        basic_breakdown = self._create_basic_flutter_breakdown(main_task, agents, collaboration_prompt)
+        basic_breakdown = self._create_basic_flutter_breakdown(
+            main_task, agents, collaboration_prompt, role_assignments
+        )
         delegation_plan["task_breakdown"] = basic_breakdown
 
         # Assign tasks based on collaboration prompt roles
         if collaboration_prompt and "Agent1" in collaboration_prompt:
-            # Parse roles from collaboration prompt
-            role_assignments = self._parse_collaboration_roles(collaboration_prompt, agents)
             delegation_plan["role_assignments"] = role_assignments
 
-        self.logger.info(f"Hierarchical delegation completed with {len(basic_breakdown)} subtasks")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Hierarchical delegation completed with {len(basic_breakdown)} subtasks")
         return delegation_plan
 
     async def _autonomous_delegation(
@@ -155,14 +331,6 @@ class SimpleDelegator:
         Returns:
             Autonomous delegation plan
         """
-        # Post delegation start
-        self.progress_board.post_update(
-            agent_name="SimpleDelegator",
-            message=f"Starting autonomous delegation with {len(agents)} agents",
-            update_type="delegation_start",
-            tags=["delegation", "autonomous"]
-        )
-
         delegation_plan = {
             "strategy": "autonomous",
             "agents": agents,
@@ -172,28 +340,48 @@ class SimpleDelegator:
             "coordination_method": "self_organization"
         }
 
-        # Each agent analyzes task and proposes contribution
-        for agent in agents:
-            self.progress_board.post_update(
-                agent_name=agent,
-                message=f"Analyzing task for autonomous contribution: {main_task[:50]}...",
-                update_type="task_analysis",
-                tags=["analysis", "autonomous"]
-            )
+        board_updates = [
+            ("post_update", {
+                "agent_name": "SimpleDelegator",
+                "message": f"Starting autonomous delegation with {len(agents)} agents",
+                "update_type": "delegation_start",
+                "tags": ["delegation", "autonomous"]
+            })
+        ]
+
+        # Each agent analyzes task and proposes contribution, all at once
+        proposals = await asyncio.gather(*(
+            self._create_agent_proposal(agent, main_task, collaboration_prompt)
+            for agent in agents
+        ))
 
-            # Create proposal based on agent name/role hints
-            proposal = self._create_agent_proposal(agent, main_task, collaboration_prompt)
+        # The analysis message is the same for every agent
+        analysis_message = f"Analyzing task for autonomous contribution: {main_task[:50]}..."
+
+        for agent, proposal in zip(agents, proposals):
+            board_updates.append(("post_update", {
+                "agent_name": agent,
+                "message": analysis_message,
+                "update_type": "task_analysis",
+                "tags": ["analysis", "autonomous"]
+            }))
+
+            # Proposal based on agent name/role hints
             delegation_plan["agent_proposals"].append(proposal)
 
             # Post proposal
-            self.progress_board.post_update(
-                agent_name=agent,
-                message=f"Proposed contribution: {proposal['contribution'][:50]}...",
-                update_type="proposal",
-                tags=["proposal", "autonomous"]
-            )
-
-        self.logger.info(f"Autonomous delegation completed with {len(agents)} proposals")
+            board_updates.append(("post_update", {
+                "agent_name": agent,
+                "message": f"Proposed contribution: {proposal['contribution'][:50]}...",
+                "update_type": "proposal",
+                "tags": ["proposal", "autonomous"]
+            }))
+
+        # Every analysis and proposal goes to the board in one write
+        await self._post_batch(board_updates)
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Autonomous delegation completed with {len(agents)} proposals")
         return delegation_plan
 
     async def _collaborative_delegation(
@@ -214,12 +402,14 @@ class SimpleDelegator:
             Collaborative delegation plan
         """
         # Post delegation start
-        self.progress_board.post_update(
-            agent_name="SimpleDelegator",
-            message=f"Starting collaborative delegation with {len(agents)} agents",
-            update_type="delegation_start",
-            tags=["delegation", "collaborative"]
-        )
+        await self._post_batch([
+            ("post_update", {
+                "agent_name": "SimpleDelegator",
+                "message": f"Starting collaborative delegation with {len(agents)} agents",
+                "update_type": "delegation_start",
+                "tags": ["delegation", "collaborative"]
+            })
+        ])
 
         delegation_plan = {
             "strategy": "collaborative",
@@ -232,37 +422,52 @@ class SimpleDelegator:
 
         # Conduct multiple rounds of negotiation
         for round_num in range(1, 4):  # 3 rounds max
-            round_negotiations = []
-
-            self.progress_board.post_update(
-                agent_name="SimpleDelegator",
-                message=f"Starting negotiation round {round_num}",
-                update_type="negotiation_round",
-                tags=["negotiation", f"round_{round_num}"]
-            )
+            round_updates = [
+                ("post_update", {
+                    "agent_name": "SimpleDelegator",
+                    "message": f"Starting negotiation round {round_num}",
+                    "update_type": "negotiation_round",
+                    "tags": ["negotiation", f"round_{round_num}"]
+                })
+            ]
 
-            # Each agent proposes or adjusts based on previous rounds
-            for agent in agents:
+            # Each agent proposes or adjusts based on previous rounds; agents
+            # only see earlier rounds, so a round's proposals run concurrently
+            if round_num == 1:
                 # In round 1, initial proposals
-                if round_num == 1:
-                    proposal = self._create_agent_proposal(agent, main_task, collaboration_prompt)
-                    message = f"Initial proposal: {proposal['contribution']}"
-                else:
-                    # Later rounds: adjustments based on coordination
-                    proposal = self._create_adjustment_proposal(agent, delegation_plan, round_num)
-                    message = f"Round {round_num} adjustment: {proposal['contribution']}"
-
-                round_negotiations.append({
-                    "agent": agent,
-                    "round": round_num,
-                    "proposal": proposal,
-                    "timestamp": self.progress_board.post_update(
-                        agent_name=agent,
-                        message=message,
-                        update_type="negotiation_proposal",
-                        tags=["negotiation", f"round_{round_num}"]
-                    )["timestamp"]
+                proposals = await asyncio.gather(*(
+                    self._create_agent_proposal(agent, main_task, collaboration_prompt)
+                    for agent in agents
+                ))
+                message_prefix = "Initial proposal"
+            else:
+                # Later rounds: adjustments based on coordination
+                proposals = await asyncio.gather(*(
+                    self._create_adjustment_proposal(agent, delegation_plan, round_num)
+                    for agent in agents
+                ))
+                message_prefix = f"Round {round_num} adjustment"
+
+            # Both lists are built at their final size in one pass each
+            round_negotiations = [
+                {"agent": agent, "round": round_num, "proposal": proposal}
+                for agent, proposal in zip(agents, proposals)
+            ]
+            round_updates.extend(
+                ("post_update", {
+                    "agent_name": agent,
+                    "message": f"{message_prefix}: {proposal['contribution']}",
+                    "update_type": "negotiation_proposal",
+                    "tags": ["negotiation", f"round_{round_num}"]
                 })
+                for agent, proposal in zip(agents, proposals)
+            )
+
+            # Post the whole round with one board write; the first result is
+            # the round start, the rest line up with the negotiations
+            posted = await self._post_batch(round_updates)
+            for negotiation, result in zip(round_negotiations, posted[1:]):
+                negotiation["timestamp"] = result.get("timestamp")
 
             delegation_plan["negotiation_rounds"].append({
                 "round": round_num,
@@ -271,93 +476,83 @@ class SimpleDelegator:
 
             # Check for consensus (simplified - agents agree on non-overlapping tasks)
             if self._check_consensus(round_negotiations):
-                self.progress_board.post_update(
-                    agent_name="SimpleDelegator",
-                    message=f"Consensus reached in round {round_num}",
-                    update_type="consensus",
-                    tags=["negotiation", "consensus"]
-                )
+                await self._post_batch([
+                    ("post_update", {
+                        "agent_name": "SimpleDelegator",
+                        "message": f"Consensus reached in round {round_num}",
+                        "update_type": "consensus",
+                        "tags": ["negotiation", "consensus"]
+                    })
+                ])
                 break
 
         # Final coordination message
-        self.progress_board.coordinate_with_team(
-            agent_name="SimpleDelegator",
-            message="Collaborative delegation completed. Beginning coordinated development.",
-            coordination_type="start_coordination"
-        )
+        await self._post_batch([
+            ("coordinate_with_team", {
+                "agent_name": "SimpleDelegator",
+                "message": "Collaborative delegation completed. Beginning coordinated development.",
+                "coordination_type": "start_coordination"
+            })
+        ])
 
-        self.logger.info(f"Collaborative delegation completed after {len(delegation_plan['negotiation_rounds'])} rounds")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Collaborative delegation completed after {len(delegation_plan['negotiation_rounds'])} rounds")
         return delegation_plan
 
     def _create_basic_flutter_breakdown(
         self,
         main_task: str,
         agents: List[str],
-        collaboration_prompt: Optional[str]
+        collaboration_prompt: Optional[str],
+        role_assignments: Optional[Dict[str, List[str]]] = None
     ) -> List[Dict[str, Any]]:
-        """Create basic Flutter app task breakdown."""
-        # Basic Flutter development tasks
+        """
+        Create basic Flutter app task breakdown.
+
+        Args:
+            main_task: Main task to break down
+            agents: Available agents
+            collaboration_prompt: Collaboration instructions
+            role_assignments: Roles already parsed from the prompt, if any
+
+        Returns:
+            Subtasks with assigned agents
+        """
+        # Basic Flutter development tasks, with fresh lists for each caller
         subtasks = [
             {
-                "id": 1,
-                "name": "UI Development",
-                "description": "Create user interface screens and widgets",
-                "assigned_agent": None,
-                "dependencies": [],
-                "estimated_hours": 8,
-                "components": ["screens", "widgets", "navigation"]
-            },
-            {
-                "id": 2,
-                "name": "Audio Features",
-                "description": "Implement audio playback and controls",
-                "assigned_agent": None,
-                "dependencies": [],
-                "estimated_hours": 6,
-                "components": ["audio_service", "player_controls", "streaming"]
-            },
-            {
-                "id": 3,
-                "name": "Data Management",
-                "description": "Create data models and state management",
-                "assigned_agent": None,
-                "dependencies": [],
-                "estimated_hours": 4,
-                "components": ["models", "providers", "storage"]
-            },
-            {
-                "id": 4,
-                "name": "Integration & Testing",
-                "description": "Integrate components and test app",
-                "assigned_agent": None,
-                "dependencies": [1, 2, 3],
-                "estimated_hours": 3,
-                "components": ["integration", "testing", "debugging"]
+                **template,
+                "dependencies": list(template["dependencies"]),
+                "components": list(template["components"])
             }
+            for template in _FLUTTER_SUBTASKS
         ]
 
-        # Assign based on collaboration prompt hints or agent names
+        # Index agents by role keyword once; each subtask then only looks up
+        # the keywords in its own name. Earlier agents win, as before.
+        role_index: Dict[str, Tuple[int, str]] = {}
         if collaboration_prompt:
-            role_assignments = self._parse_collaboration_roles(collaboration_prompt, agents)
-            for subtask in subtasks:
-                for agent, roles in role_assignments.items():
-                    if any(role.lower() in subtask["name"].lower() for role in roles):
-                        subtask["assigned_agent"] = agent
-                        break
+            if role_assignments is None:
+                role_assignments = self._parse_collaboration_roles(collaboration_prompt, agents)
+            for position, (agent, roles) in enumerate(role_assignments.items()):
+                for role in roles:
+                    role_index.setdefault(role.lower(), (position, agent))
 
         # Fallback assignment by agent name hints
-        for subtask in subtasks:
-            if subtask["assigned_agent"] is None:
-                for agent in agents:
-                    if ("ui" in agent.lower() and "ui" in subtask["name"].lower()) or \
-                       ("audio" in agent.lower() and "audio" in subtask["name"].lower()) or \
-                       ("data" in agent.lower() and "data" in subtask["name"].lower()):
-                        subtask["assigned_agent"] = agent
-                        break
-
+        name_index: Dict[str, Tuple[int, str]] = {}
+        for position, agent in enumerate(agents):
+            agent_lower = agent.lower()
+            for keyword in _SUBTASK_KEYWORDS:
+                if keyword in agent_lower:
+                    name_index.setdefault(keyword, (position, agent))
+
+        for subtask, keywords in zip(subtasks, _FLUTTER_SUBTASK_KEYWORDS):
+            subtask["assigned_agent"] = (
+                _first_indexed_agent(role_index, keywords)
+                or _first_indexed_agent(name_index, keywords)
                 # Default assignment
-                if subtask["assigned_agent"] is None:
-                    subtask["assigned_agent"] = agents[subtask["id"] % len(agents)]
+                or agents[subtask["id"] % len(agents)]
+            )
 
         return subtasks
 
@@ -369,131 +564,114 @@ class SimpleDelegator:
         """Parse agent roles from collaboration prompt."""
         role_assignments = {}
 
+        agents_lower = [(agent, agent.lower()) for agent in agents]
+
+        # Roles are only recorded after an agent is named, so a prompt that
+        # never mentions one has nothing to parse
+        prompt_lower = collaboration_prompt.lower()
+        if not any(agent_lower in prompt_lower for _, agent_lower in agents_lower):
+            return role_assignments
+
         # Simple parsing - look for agent role descriptions
         lines = collaboration_prompt.split('\n')
         current_agent = None
 
         for line in lines:
-            line = line.strip()
+            line_lower = line.strip().lower()
 
             # Look for agent role definitions
-            if any(agent.lower() in line.lower() for agent in agents):
-                for agent in agents:
-                    if agent.lower() in line.lower():
-                        current_agent = agent
-                        role_assignments[agent] = []
-                        break
+            for agent, agent_lower in agents_lower:
+                if agent_lower in line_lower:
+                    current_agent = agent
+                    role_assignments[agent] = []
+                    break
 
             # Extract role keywords
-            if current_agent and ("focuses on" in line.lower() or "handles" in line.lower() or "manages" in line.lower()):
-                roles = []
-                if "ui" in line.lower() or "interface" in line.lower():
-                    roles.append("UI")
-                if "audio" in line.lower() or "music" in line.lower() or "playback" in line.lower():
-                    roles.append("Audio")
-                if "data" in line.lower() or "state" in line.lower() or "model" in line.lower():
-                    roles.append("Data")
+            if current_agent and any(keyword in line_lower for keyword in _ROLE_VERBS):
+                roles = _find_roles(_PROMPT_ROLE_RE, line_lower)
 
                 if roles and current_agent in role_assignments:
                     role_assignments[current_agent].extend(roles)
 
         return role_assignments
 
-    def _create_agent_proposal(
+    async def _create_agent_proposal(
         self,
         agent: str,
         main_task: str,
         collaboration_prompt: Optional[str]
     ) -> Dict[str, Any]:
         """Create a proposal for what an agent can contribute."""
-        # Analyze agent name/role for capabilities
-        capabilities = []
-        focus_areas = []
-
-        agent_lower = agent.lower()
-        if "ui" in agent_lower or "interface" in agent_lower:
-            capabilities.extend(["UI Development", "Widget Creation", "Navigation"])
-            focus_areas.append("User Interface")
-
-        if "audio" in agent_lower or "music" in agent_lower:
-            capabilities.extend(["Audio Playback", "Music Controls", "Streaming"])
-            focus_areas.append("Audio Features")
-
-        if "data" in agent_lower or "state" in agent_lower:
-            capabilities.extend(["Data Models", "State Management", "Storage"])
-            focus_areas.append("Data Management")
-
-        if not capabilities:  # Generic agent
-            capabilities = ["General Development", "Code Review", "Testing"]
-            focus_areas.append("General Support")
-
-        # Create contribution proposal
-        if "flutter" in main_task.lower() and "music" in main_task.lower():
-            if "ui" in agent_lower:
-                contribution = "I'll handle the Flutter UI - screens, widgets, navigation, and user interface design using Material Design 3"
-                estimated_time = "6-8 hours"
-            elif "audio" in agent_lower:
-                contribution = "I'll implement audio playback features - music player controls, streaming service, and audio state management"
-                estimated_time = "5-7 hours"
-            elif "data" in agent_lower:
-                contribution = "I'll create data models, state management providers, and handle app data persistence"
-                estimated_time = "4-6 hours"
-            else:
-                contribution = f"I'll provide {focus_areas[0].lower()} support and help with integration and testing"
-                estimated_time = "3-5 hours"
-        else:
-            contribution = f"I can contribute {', '.join(capabilities).lower()} to support the main task"
-            estimated_time = "4-6 hours"
+        main_task_lower = main_task.lower()
+        contribution, capabilities, focus_areas, estimated_time = _proposal_fields(
+            agent, "flutter" in main_task_lower and "music" in main_task_lower
+        )
 
+        # Fresh containers so adjustments never leak into the cached fields
         return {
             "agent": agent,
             "contribution": contribution,
-            "capabilities": capabilities,
-            "focus_areas": focus_areas,
+            "capabilities": list(capabilities),
+            "focus_areas": list(focus_areas),
             "estimated_time": estimated_time,
             "dependencies": [],
             "collaboration_notes": "Ready to coordinate with team members"
         }
 
-    def _create_adjustment_proposal(
+    async def _create_adjustment_proposal(
         self,
         agent: str,
         delegation_plan: Dict[str, Any],
         round_num: int
     ) -> Dict[str, Any]:
         """Create an adjusted proposal based on previous negotiation rounds."""
-        # Get previous proposals
-        previous_proposals = []
-        for round_data in delegation_plan.get("negotiation_rounds", []):
-            for negotiation in round_data.get("negotiations", []):
+        # Start from the agent's most recent proposal, searching backwards
+        base_proposal = None
+        for round_data in reversed(delegation_plan.get("negotiation_rounds", [])):
+            for negotiation in reversed(round_data.get("negotiations", [])):
                 if negotiation["agent"] == agent:
-                    previous_proposals.append(negotiation["proposal"])
+                    base_proposal = negotiation["proposal"]
+                    break
+            if base_proposal is not None:
+                break
 
-        base_proposal = previous_proposals[-1] if previous_proposals else self._create_agent_proposal(
-            agent, delegation_plan["main_task"], delegation_plan["collaboration_prompt"]
-        )
+        if base_proposal is None:
+            base_proposal = await self._create_agent_proposal(
+                agent, delegation_plan["main_task"], delegation_plan["collaboration_prompt"]
+            )
 
         # Make adjustments based on round
         if round_num == 2:
             # Add coordination elements
-            base_proposal["contribution"] += " | Will coordinate interface definitions with team"
-            base_proposal["collaboration_notes"] = "Sharing interfaces early and requesting code reviews"
+            suffix = " | Will coordinate interface definitions with team"
+            notes = "Sharing interfaces early and requesting code reviews"
         elif round_num == 3:
             # Final adjustments
-            base_proposal["contribution"] += " | Ready for final coordination and integration"
-            base_proposal["collaboration_notes"] = "Finalized approach, ready to begin development"
+            suffix = " | Ready for final coordination and integration"
+            notes = "Finalized approach, ready to begin development"
+        else:
+            suffix = ""
+            notes = base_proposal["collaboration_notes"]
 
-        return base_proposal
+        # Build a new proposal so earlier rounds keep the proposal they recorded
+        return {
+            **base_proposal,
+            "contribution": base_proposal["contribution"] + suffix,
+            "collaboration_notes": notes
+        }
 
     def _check_consensus(self, negotiations: List[Dict[str, Any]]) -> bool:
         """Check if agents have reached consensus (simplified logic)."""
-        # Simple consensus: each agent has non-overlapping focus areas
-        focus_areas = set()
+        # Simple consensus: each agent has non-overlapping focus areas, i.e.
+        # no area is counted twice across all proposals. Areas are claimed
+        # proposal by proposal so the first overlap ends the check.
+        claimed_focus = set()
+        total_areas = 0
         for negotiation in negotiations:
-            agent_focus = negotiation["proposal"]["focus_areas"]
-            for area in agent_focus:
-                if area in focus_areas:
-                    return False  # Overlap found
-                focus_areas.add(area)
+            focus_areas = negotiation["proposal"]["focus_areas"]
+            claimed_focus.update(focus_areas)
+            total_areas += len(focus_areas)
+            if len(claimed_focus) != total_areas:
+                return False
 
-        return len(focus_areas) >= len(negotiations)  # Each agent has unique focus
+        return total_areas >= len(negotiations)  # Each agent has unique focus
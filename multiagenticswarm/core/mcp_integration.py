@@ -5,38 +5,95 @@ This module provides MCP server and client implementations to enable
 standardized tool sharing and interoperability with external systems.
 """
 
-import json
+import importlib.util
+import itertools
+import logging
 import uuid
 import asyncio
+import sys
 import time
+from urllib.parse import urlparse
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
 
-try:
-    import websockets
-    from websockets.server import WebSocketServerProtocol
-    from websockets.client import WebSocketClientProtocol
-    WEBSOCKETS_AVAILABLE = True
-except ImportError:
-    WEBSOCKETS_AVAILABLE = False
-    WebSocketServerProtocol = None
-    WebSocketClientProtocol = None
+# Transport libraries are only imported when a server or client actually
+# starts, so importing the package stays cheap for agent-only users
+WEBSOCKETS_AVAILABLE = importlib.util.find_spec("websockets") is not None
+AIOHTTP_AVAILABLE = importlib.util.find_spec("aiohttp") is not None
 
 try:
-    import aiohttp
-    from aiohttp import web
-    AIOHTTP_AVAILABLE = True
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
 except ImportError:
-    AIOHTTP_AVAILABLE = False
-    web = None
+    FASTJSONSCHEMA_AVAILABLE = False
 
+from . import _loop, _serde
 from .base_tool import BaseTool, ToolCallRequest, ToolCallResponse, ToolScope
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Ids for tool calls made through MCPTool; only need to be unique in-process
+_tool_call_ids = itertools.count(1)
+
+# Message dataclasses use __slots__ where dataclasses support it (3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _compile_schema(schema: Optional[Dict[str, Any]]) -> Optional[Callable[[Any], Any]]:
+    """
+    Compile a tool's inputSchema into a validator callable.
+
+    The validator raises ValueError for arguments that do not match. Returns
+    None when fastjsonschema is not installed, the schema is empty, or it
+    cannot be compiled; callers then skip validation.
+    """
+    if not FASTJSONSCHEMA_AVAILABLE or not schema:
+        return None
+    try:
+        return fastjsonschema.compile(schema, use_default=False)
+    except Exception as e:
+        logger.warning(f"Could not compile input schema, skipping validation: {e}")
+        return None
+
+
+def _wants_msgpack(capabilities: Optional[Dict[str, Any]]) -> bool:
+    """
+    Check whether a peer's capabilities opt in to MessagePack frames.
+    
+    Both ends must have msgspec installed, since binary frames are encoded
+    with _serde.packb.
+    """
+    if not _serde.MSGSPEC_AVAILABLE or not isinstance(capabilities, dict):
+        return False
+    experimental = capabilities.get("experimental")
+    return isinstance(experimental, dict) and "msgpack" in experimental
+
+
+# Reply to undecodable frames; it never varies, so it is encoded once
+_PARSE_ERROR_FRAME = _serde.dumps_str({
+    "jsonrpc": "2.0",
+    "error": {"code": -32700, "message": "Parse error"}
+})
+
+
+def _reply(
+    request_id: Optional[Union[str, int]],
+    result: Optional[Any] = None,
+    error: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Build a JSON-RPC reply object, leaving out empty fields like MCPMessage.to_dict."""
+    reply = {"jsonrpc": "2.0"}
+    if request_id is not None:
+        reply["id"] = request_id
+    if result is not None:
+        reply["result"] = result
+    if error is not None:
+        reply["error"] = error
+    return reply
+
 
 class MCPTransportType(str, Enum):
     """MCP transport types."""
@@ -45,7 +102,7 @@ class MCPTransportType(str, Enum):
     STDIO = "stdio"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MCPMessage:
     """MCP protocol message format."""
     jsonrpc: str = "2.0"
@@ -83,7 +140,7 @@ class MCPMessage:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MCPCapability:
     """MCP capability description."""
     name: str
@@ -92,7 +149,7 @@ class MCPCapability:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MCPToolDescriptor:
     """MCP tool descriptor following the protocol specification."""
     name: str
@@ -136,15 +193,29 @@ class MCPTool(BaseTool):
         self.mcp_client = mcp_client
         self.metadata = metadata or {}
         self.is_external = True
+        self._validator = _compile_schema(self.parameters)
+        
+        # create_mcp_tools builds one wrapper per remote tool
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Created MCP tool wrapper '{name}' for external tool")
+    
+    def validate_arguments(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate against the compiled inputSchema before the network round trip."""
+        if self._validator is not None:
+            try:
+                self._validator(arguments)
+            except ValueError as e:
+                raise ValueError(f"Validation error: {e}")
+            return arguments
         
-        logger.info(f"Created MCP tool wrapper '{name}' for external tool")
+        return super().validate_arguments(arguments)
     
     async def _execute_impl(self, **kwargs) -> Any:
         """Execute the external MCP tool via the client."""
         try:
             # Create tool call request for the external MCP server
             request = ToolCallRequest(
-                id=str(uuid.uuid4()),
+                id=str(next(_tool_call_ids)),
                 name=self.name,
                 arguments=kwargs
             )
@@ -170,13 +241,18 @@ class MCPServer:
     MultiAgenticSwarm system.
     """
     
+    # Running TCP servers by "host:port", so clients in the same process can
+    # call them directly instead of going through a socket
+    _local_registry: Dict[str, "MCPServer"] = {}
+    
     def __init__(
         self,
         name: str = "MultiAgenticSwarm",
         version: str = "1.0.0",
         host: str = "localhost",
         port: int = 8765,
-        transport: MCPTransportType = MCPTransportType.WEBSOCKET
+        transport: MCPTransportType = MCPTransportType.WEBSOCKET,
+        use_uvloop: bool = False
     ):
         self.name = name
         self.version = version
@@ -184,12 +260,41 @@ class MCPServer:
         self.port = port
         self.transport = transport
         
+        # Opt-in, since the policy applies to every loop the process creates later
+        if use_uvloop:
+            _loop.install_uvloop()
+        
         # Tool registry - only tools that should be exposed via MCP
         self.exposed_tools: Dict[str, BaseTool] = {}
         
+        # Compiled inputSchema validators, built once per exposed tool
+        self._validators: Dict[str, Callable[[Any], Any]] = {}
+        
+        # Prebuilt protocol responses; tools/list is reset when the tool set
+        # changes, initialize is rebuilt if name or version change
+        self._tools_list_result: Optional[Dict[str, Any]] = None
+        self._initialize_result: Optional[Dict[str, Any]] = None
+        
         # Client connections
         self.clients: Dict[str, Any] = {}
         
+        # WebSocket dispatch limits; the semaphore is created on the serving loop
+        self.max_concurrent_dispatch = 32
+        self.send_queue_size = 256
+        self._dispatch_slots: Optional[asyncio.Semaphore] = None
+        
+        # Upper bound on tool executions running at once across all clients
+        self.max_concurrent_tool_calls = 64
+        self._tool_slots: Optional[asyncio.Semaphore] = None
+        
+        # permessage-deflate costs more CPU than it saves on small JSON-RPC
+        # frames; set to "deflate" to turn it back on for slow links
+        self.websocket_compression: Optional[str] = None
+        
+        # Listen on this Unix socket instead of host:port, e.g. behind a
+        # local reverse proxy that terminates external connections
+        self.unix_socket_path: Optional[str] = None
+        
         # Server state
         self.running = False
         self.server = None
@@ -210,6 +315,12 @@ class MCPServer:
             return
         
         self.exposed_tools[tool.name] = tool
+        validator = _compile_schema(tool.parameters)
+        if validator is not None:
+            self._validators[tool.name] = validator
+        else:
+            self._validators.pop(tool.name, None)
+        self._tools_list_result = None
         logger.info(f"Exposed tool '{tool.name}' via MCP server")
     
     def expose_tools(self, tools: List[BaseTool], force_global: bool = False) -> None:
@@ -221,6 +332,8 @@ class MCPServer:
         """Remove a tool from MCP exposure."""
         if tool_name in self.exposed_tools:
             del self.exposed_tools[tool_name]
+            self._validators.pop(tool_name, None)
+            self._tools_list_result = None
             logger.info(f"Removed tool '{tool_name}' from MCP exposure")
             return True
         return False
@@ -245,33 +358,70 @@ class MCPServer:
     
     async def handle_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle MCP initialize request."""
-        return {
-            "protocolVersion": "2024-11-05",
-            "capabilities": {
-                "tools": {
-                    "listChanged": True
+        result = self._initialize_result
+        if (
+            result is None
+            or result["serverInfo"]["name"] != self.name
+            or result["serverInfo"]["version"] != self.version
+        ):
+            result = self._initialize_result = {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {
+                    "tools": {
+                        "listChanged": True
+                    },
+                    # Binary MessagePack frames for peers that opt in
+                    **({"experimental": {"msgpack": {}}} if _serde.MSGSPEC_AVAILABLE else {})
+                },
+                "serverInfo": {
+                    "name": self.name,
+                    "version": self.version
                 }
-            },
-            "serverInfo": {
-                "name": self.name,
-                "version": self.version
             }
-        }
+        return result
     
     async def handle_tools_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tools/list request."""
-        tools = []
-        for descriptor in self.get_tool_descriptors():
-            tools.append({
-                "name": descriptor.name,
-                "description": descriptor.description,
-                "inputSchema": descriptor.inputSchema
-            })
+        if self._tools_list_result is None:
+            self._tools_list_result = {
+                "tools": [
+                    {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "inputSchema": tool.parameters
+                    }
+                    for tool in self.exposed_tools.values()
+                ]
+            }
         
-        return {"tools": tools}
+        return self._tools_list_result
     
-    async def handle_tools_call(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle tools/call request."""
+    def validate_tool_arguments(self, params: Dict[str, Any]) -> Optional[str]:
+        """
+        Check tools/call arguments against the tool's compiled inputSchema.
+        
+        Args:
+            params: tools/call request parameters
+            
+        Returns:
+            The validation error message, or None if the arguments are valid or
+            the tool has no compiled validator
+        """
+        validator = self._validators.get(params.get("name"))
+        if validator is None:
+            return None
+        try:
+            validator(params.get("arguments", {}))
+        except ValueError as e:
+            return str(e)
+        return None
+    
+    async def handle_tools_call(
+        self,
+        params: Dict[str, Any],
+        request_id: Optional[Union[str, int]] = None
+    ) -> Dict[str, Any]:
+        """Handle tools/call request, reusing the JSON-RPC request id when given."""
         try:
             tool_name = params.get("name")
             arguments = params.get("arguments", {})
@@ -283,13 +433,17 @@ class MCPServer:
             
             # Create tool call request
             request = ToolCallRequest(
-                id=str(uuid.uuid4()),
+                id=str(request_id) if request_id is not None else str(uuid.uuid4()),
                 name=tool_name,
                 arguments=arguments
             )
             
-            # Execute tool (use "mcp_client" as agent name)
-            response = await tool.execute(request, "mcp_client")
+            # Execute tool (use "mcp_client" as agent name); synchronous
+            # FunctionTools run in the shared tool thread pool
+            if self._tool_slots is None:
+                self._tool_slots = asyncio.Semaphore(self.max_concurrent_tool_calls)
+            async with self._tool_slots:
+                response = await tool.execute(request, "mcp_client")
             
             if response.success:
                 return {
@@ -326,73 +480,210 @@ class MCPServer:
     
     async def handle_message(self, message: MCPMessage, client_id: str) -> MCPMessage:
         """Handle incoming MCP message."""
+        reply = await self._handle_request(message.method, message.id, message.params, client_id)
+        return MCPMessage.from_dict(reply)
+    
+    async def _handle_request(
+        self,
+        method: Optional[str],
+        request_id: Optional[Union[str, int]],
+        params: Optional[Dict[str, Any]],
+        client_id: str
+    ) -> Dict[str, Any]:
+        """
+        Handle one request and return the reply as JSON-ready data.
+        
+        The transports call this with fields taken straight from the decoded
+        payload, so no MCPMessage is built on either side of a request.
+        """
         try:
-            if message.method == "initialize":
-                result = await self.handle_initialize(message.params or {})
-                return MCPMessage(id=message.id, result=result)
+            if method == "initialize":
+                result = await self.handle_initialize(params or {})
+                return _reply(request_id, result=result)
             
-            elif message.method == "tools/list":
-                result = await self.handle_tools_list(message.params or {})
-                return MCPMessage(id=message.id, result=result)
+            elif method == "tools/list":
+                result = await self.handle_tools_list(params or {})
+                return _reply(request_id, result=result)
             
-            elif message.method == "tools/call":
-                result = await self.handle_tools_call(message.params or {})
-                return MCPMessage(id=message.id, result=result)
+            elif method == "tools/call":
+                params = params or {}
+                validation_error = self.validate_tool_arguments(params)
+                if validation_error is not None:
+                    return _reply(request_id, error={
+                        "code": -32602,
+                        "message": f"Invalid params: {validation_error}"
+                    })
+                result = await self.handle_tools_call(params, request_id)
+                return _reply(request_id, result=result)
             
             else:
-                return MCPMessage(
-                    id=message.id,
-                    error={
-                        "code": -32601,
-                        "message": f"Method not found: {message.method}"
-                    }
-                )
+                return _reply(request_id, error={
+                    "code": -32601,
+                    "message": f"Method not found: {method}"
+                })
                 
         except Exception as e:
             logger.error(f"Error handling MCP message: {e}")
-            return MCPMessage(
-                id=message.id,
-                error={
-                    "code": -32603,
-                    "message": f"Internal error: {str(e)}"
-                }
+            return _reply(request_id, error={
+                "code": -32603,
+                "message": f"Internal error: {str(e)}"
+            })
+    
+    async def _handle_payload(self, payload: Any, client_id: str) -> Any:
+        """
+        Handle a decoded request payload, either one object or a batch array.
+        
+        Returns the reply as JSON-ready data: an object, or an array for a
+        non-empty batch. Anything that is not an object is an Invalid Request.
+        """
+        if isinstance(payload, dict):
+            return await self._handle_request(
+                payload.get("method"), payload.get("id"), payload.get("params"), client_id
             )
+        
+        if not isinstance(payload, list) or not payload:
+            return _reply(None, error={"code": -32600, "message": "Invalid Request"})
+        
+        # Batch entries must be objects; nested arrays are invalid too
+        return list(await asyncio.gather(*(
+            self._handle_payload(entry if isinstance(entry, dict) else None, client_id)
+            for entry in payload
+        )))
+    
+    async def _handle_local(self, payload: Any, client_id: str) -> Any:
+        """
+        Handle a payload from a client in this process, as if it came over a socket.
+        
+        The request and reply are copied through the JSON codec, so neither
+        side ever holds the other's dicts (including the cached initialize
+        and tools/list results), and each call takes a dispatch slot like a
+        WebSocket message does.
+        """
+        if self._dispatch_slots is None:
+            self._dispatch_slots = asyncio.Semaphore(self.max_concurrent_dispatch)
+        async with self._dispatch_slots:
+            reply = await self._handle_payload(_serde.loads(_serde.dumps(payload)), client_id)
+        return _serde.loads(_serde.dumps(reply))
+    
+    async def handle_batch(
+        self,
+        batch: List[Any],
+        client_id: str
+    ) -> Union[MCPMessage, List[MCPMessage]]:
+        """
+        Handle a JSON-RPC batch request.
+        
+        The messages in the batch are handled concurrently. Replies come back
+        in request order.
+        
+        Args:
+            batch: Decoded JSON array from the client
+            client_id: Identifier of the requesting client
+            
+        Returns:
+            One reply per batch entry, or a single Invalid Request error for an
+            empty batch
+        """
+        reply = await self._handle_payload(batch, client_id)
+        if isinstance(reply, list):
+            return [MCPMessage.from_dict(data) for data in reply]
+        return MCPMessage.from_dict(reply)
+    
+    async def _handle_websocket_client(self, websocket, path: Optional[str] = None) -> None:
+        """
+        Serve one WebSocket client.
+
+        Messages are dispatched concurrently, bounded by the server-wide
+        dispatch limit, and a per-client writer task sends the responses in
+        completion order. JSON-RPC responses carry the request id, so clients
+        can match them up.
+        """
+        client_id = str(uuid.uuid4())
+        self.clients[client_id] = websocket
+        # Skip formatting per-connection messages when INFO is filtered out
+        log_connections = logger.isEnabledFor(logging.INFO)
+        if log_connections:
+            logger.info(f"MCP client connected: {client_id}")
+        
+        if self._dispatch_slots is None:
+            self._dispatch_slots = asyncio.Semaphore(self.max_concurrent_dispatch)
+        dispatch_slots = self._dispatch_slots
+        out_queue: asyncio.Queue = asyncio.Queue(maxsize=self.send_queue_size)
+        
+        async def writer() -> None:
+            while True:
+                data = await out_queue.get()
+                await websocket.send(data)
+        
+        async def dispatch(payload: Any, binary: bool) -> None:
+            reply = await self._handle_payload(payload, client_id)
+            # Replies mirror the request: MessagePack for negotiated binary
+            # frames, otherwise JSON text frames as MCP clients expect
+            await out_queue.put(_serde.packb(reply) if binary else _serde.dumps_str(reply))
+        
+        def release_slot(task: asyncio.Task) -> None:
+            dispatch_tasks.discard(task)
+            dispatch_slots.release()
+        
+        writer_task = asyncio.create_task(writer())
+        dispatch_tasks = set()
+        # Set once the client's initialize opts in to MessagePack frames
+        msgpack_frames = False
+        
+        try:
+            async for message_str in websocket:
+                binary = msgpack_frames and not isinstance(message_str, str)
+                try:
+                    message_data = _serde.unpackb(message_str) if binary else _serde.loads(message_str)
+                except _serde.DECODE_ERRORS:
+                    await out_queue.put(_PARSE_ERROR_FRAME)
+                    continue
+                # An initialize request may opt in to MessagePack frames
+                if isinstance(message_data, dict) and message_data.get("method") == "initialize":
+                    params = message_data.get("params")
+                    msgpack_frames = isinstance(params, dict) and _wants_msgpack(params.get("capabilities"))
+                
+                # Wait for a free slot so a burst cannot start unbounded work
+                await dispatch_slots.acquire()
+                task = asyncio.create_task(dispatch(message_data, binary))
+                dispatch_tasks.add(task)
+                # A done callback also fires for tasks cancelled before they start
+                task.add_done_callback(release_slot)
+                    
+        except Exception as e:
+            logger.error(f"Error handling MCP client {client_id}: {e}")
+        finally:
+            # The iteration only ends once the connection is closed, so
+            # unsent responses have nowhere to go
+            for task in (*dispatch_tasks, writer_task):
+                task.cancel()
+            await asyncio.gather(*dispatch_tasks, writer_task, return_exceptions=True)
+            if client_id in self.clients:
+                del self.clients[client_id]
+            if log_connections:
+                logger.info(f"MCP client disconnected: {client_id}")
     
     async def start_websocket_server(self) -> None:
         """Start WebSocket server."""
         if not WEBSOCKETS_AVAILABLE:
             raise ImportError("websockets library not available. Install with: pip install websockets")
         
-        async def handle_client(websocket, path):
-            client_id = str(uuid.uuid4())
-            self.clients[client_id] = websocket
-            logger.info(f"MCP client connected: {client_id}")
-            
-            try:
-                async for message_str in websocket:
-                    try:
-                        message_data = json.loads(message_str)
-                        message = MCPMessage.from_dict(message_data)
-                        
-                        response = await self.handle_message(message, client_id)
-                        response_str = json.dumps(response.to_dict())
-                        await websocket.send(response_str)
-                        
-                    except json.JSONDecodeError as e:
-                        error_response = MCPMessage(
-                            error={"code": -32700, "message": "Parse error"}
-                        )
-                        await websocket.send(json.dumps(error_response.to_dict()))
-                        
-            except Exception as e:
-                logger.error(f"Error handling MCP client {client_id}: {e}")
-            finally:
-                if client_id in self.clients:
-                    del self.clients[client_id]
-                logger.info(f"MCP client disconnected: {client_id}")
-        
         import websockets
-        self.server = await websockets.serve(handle_client, self.host, self.port)
+        if self.unix_socket_path:
+            self.server = await websockets.unix_serve(
+                self._handle_websocket_client,
+                self.unix_socket_path,
+                compression=self.websocket_compression
+            )
+            logger.info(f"MCP WebSocket server started on unix:{self.unix_socket_path}")
+            return
+        
+        self.server = await websockets.serve(
+            self._handle_websocket_client,
+            self.host,
+            self.port,
+            compression=self.websocket_compression
+        )
         logger.info(f"MCP WebSocket server started on ws://{self.host}:{self.port}")
     
     async def start_http_server(self) -> None:
@@ -400,30 +691,44 @@ class MCPServer:
         if not AIOHTTP_AVAILABLE:
             raise ImportError("aiohttp library not available. Install with: pip install aiohttp")
         
+        from aiohttp import web
+        
         async def handle_http_request(request):
             try:
-                data = await request.json()
-                message = MCPMessage.from_dict(data)
+                data = _serde.loads(await request.read())
+                reply = await self._handle_payload(data, "http_client")
                 
-                response = await self.handle_message(message, "http_client")
-                return web.json_response(response.to_dict())
+                return web.Response(
+                    body=_serde.dumps(reply),
+                    content_type="application/json"
+                )
                 
             except Exception as e:
                 error_response = MCPMessage(
                     error={"code": -32603, "message": f"Internal error: {str(e)}"}
                 )
-                return web.json_response(error_response.to_dict(), status=500)
+                return web.Response(
+                    body=_serde.dumps(error_response.to_dict()),
+                    content_type="application/json",
+                    status=500
+                )
         
         app = web.Application()
         app.router.add_post('/mcp', handle_http_request)
         
         runner = web.AppRunner(app)
         await runner.setup()
-        site = web.TCPSite(runner, self.host, self.port)
+        if self.unix_socket_path:
+            site = web.UnixSite(runner, self.unix_socket_path)
+        else:
+            site = web.TCPSite(runner, self.host, self.port)
         await site.start()
         
         self.server = runner
-        logger.info(f"MCP HTTP server started on http://{self.host}:{self.port}/mcp")
+        if self.unix_socket_path:
+            logger.info(f"MCP HTTP server started on unix:{self.unix_socket_path} at /mcp")
+        else:
+            logger.info(f"MCP HTTP server started on http://{self.host}:{self.port}/mcp")
     
     async def start(self) -> None:
         """Start the MCP server."""
@@ -440,6 +745,10 @@ class MCPServer:
                 raise ValueError(f"Unsupported transport type: {self.transport}")
             
             self.running = True
+            # A Unix socket server is not listening on host:port, so TCP
+            # clients must not be routed to it
+            if not self.unix_socket_path:
+                MCPServer._local_registry[f"{self.host}:{self.port}"] = self
             logger.info(f"MCP server '{self.name}' started successfully")
             
         except Exception as e:
@@ -461,6 +770,10 @@ class MCPServer:
             
             self.running = False
             self.clients.clear()
+            self._dispatch_slots = None
+            self._tool_slots = None
+            if MCPServer._local_registry.get(f"{self.host}:{self.port}") is self:
+                del MCPServer._local_registry[f"{self.host}:{self.port}"]
             logger.info(f"MCP server '{self.name}' stopped")
             
         except Exception as e:
@@ -491,17 +804,39 @@ class MCPClient:
         self,
         server_url: str,
         name: str = "MultiAgenticSwarm-Client",
-        transport: MCPTransportType = MCPTransportType.WEBSOCKET
+        transport: MCPTransportType = MCPTransportType.WEBSOCKET,
+        use_uvloop: bool = False
     ):
         self.server_url = server_url
         self.name = name
         self.transport = transport
         
+        # Opt-in, since the policy applies to every loop the process creates later
+        if use_uvloop:
+            _loop.install_uvloop()
+        
+        # JSON-RPC request ids only need to be unique per connection
+        self._next_id = itertools.count(1)
+        
         # Connection state
         self.connected = False
         self.connection = None
         self.session = None
         
+        # Opt in to MessagePack WebSocket frames; only used when the server
+        # advertises support and msgspec is installed on both ends
+        self.prefer_msgpack = False
+        self._msgpack_frames = False
+        
+        # Server running in this process at server_url, called directly;
+        # set use_local_server to False to always go through the transport
+        self.use_local_server = True
+        self._local_server: Optional[MCPServer] = None
+        
+        # WebSocket replies are routed by id to the futures of waiting callers
+        self._pending: Dict[Any, asyncio.Future] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+        
         # Remote server info
         self.server_info: Optional[Dict[str, Any]] = None
         self.server_capabilities: Optional[Dict[str, Any]] = None
@@ -516,7 +851,10 @@ class MCPClient:
             return
         
         try:
-            if self.transport == MCPTransportType.WEBSOCKET:
+            self._local_server = self._find_local_server()
+            if self._local_server is not None:
+                logger.info(f"Using in-process MCP server '{self._local_server.name}' for {self.server_url}")
+            elif self.transport == MCPTransportType.WEBSOCKET:
                 await self._connect_websocket()
             elif self.transport == MCPTransportType.HTTP:
                 await self._connect_http()
@@ -536,13 +874,34 @@ class MCPClient:
             logger.error(f"Failed to connect to MCP server: {e}")
             raise
     
+    def _find_local_server(self) -> Optional[MCPServer]:
+        """Return the running in-process server that server_url points at, if any."""
+        if not self.use_local_server:
+            return None
+        try:
+            parsed = urlparse(self.server_url)
+            key = f"{parsed.hostname}:{parsed.port}"
+        except ValueError:
+            return None
+        
+        server = MCPServer._local_registry.get(key)
+        if server is None or not server.running or server.transport != self.transport:
+            return None
+        return server
+    
     async def _connect_websocket(self) -> None:
         """Connect via WebSocket."""
         if not WEBSOCKETS_AVAILABLE:
             raise ImportError("websockets library not available. Install with: pip install websockets")
         
         import websockets
-        self.connection = await websockets.connect(self.server_url)
+        # Tool results can be large; allow up to 16 MiB frames and skip
+        # per-message deflate, which costs more than it saves on unique payloads
+        self.connection = await websockets.connect(
+            self.server_url,
+            max_size=2 ** 24,
+            compression=None
+        )
     
     async def _connect_http(self) -> None:
         """Connect via HTTP."""
@@ -550,17 +909,32 @@ class MCPClient:
             raise ImportError("aiohttp library not available. Install with: pip install aiohttp")
         
         import aiohttp
-        self.session = aiohttp.ClientSession()
+        if self.session is not None and not self.session.closed:
+            return
+        
+        # Keep connections alive between tool calls so each call skips the
+        # TCP/TLS handshake; request bodies are encoded with _serde already
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            ),
+            json_serialize=_serde.dumps_str
+        )
     
     async def _initialize(self) -> None:
         """Initialize MCP connection."""
         message = MCPMessage(
-            id=str(uuid.uuid4()),
+            id=next(self._next_id),
             method="initialize",
             params={
                 "protocolVersion": "2024-11-05",
                 "capabilities": {
-                    "tools": {}
+                    "tools": {},
+                    **({"experimental": {"msgpack": {}}} if self._offers_msgpack() else {})
                 },
                 "clientInfo": {
                     "name": self.name,
@@ -576,13 +950,22 @@ class MCPClient:
         
         self.server_info = response.result.get("serverInfo", {})
         self.server_capabilities = response.result.get("capabilities", {})
+        self._msgpack_frames = self._offers_msgpack() and _wants_msgpack(self.server_capabilities)
         
         logger.info(f"Initialized MCP connection with server: {self.server_info}")
     
+    def _offers_msgpack(self) -> bool:
+        """Whether this client asks for MessagePack frames during initialize."""
+        return (
+            self.prefer_msgpack
+            and _serde.MSGSPEC_AVAILABLE
+            and self.transport == MCPTransportType.WEBSOCKET
+        )
+    
     async def _discover_tools(self) -> None:
         """Discover available tools from the server."""
         message = MCPMessage(
-            id=str(uuid.uuid4()),
+            id=next(self._next_id),
             method="tools/list",
             params={}
         )
@@ -601,7 +984,11 @@ class MCPClient:
     async def _send_message(self, message: MCPMessage) -> MCPMessage:
         """Send message to MCP server and wait for response."""
         try:
-            if self.transport == MCPTransportType.WEBSOCKET:
+            if self._local_server is not None:
+                return MCPMessage.from_dict(
+                    await self._local_server._handle_local(message.to_dict(), self.name)
+                )
+            elif self.transport == MCPTransportType.WEBSOCKET:
                 return await self._send_websocket_message(message)
             elif self.transport == MCPTransportType.HTTP:
                 return await self._send_http_message(message)
@@ -612,44 +999,192 @@ class MCPClient:
             logger.error(f"Error sending MCP message: {e}")
             raise
     
-    async def _send_websocket_message(self, message: MCPMessage) -> MCPMessage:
-        """Send message via WebSocket."""
+    async def _send_batch(self, messages: List[MCPMessage]) -> List[MCPMessage]:
+        """Send several messages as one JSON-RPC batch and return the replies."""
+        try:
+            payload = [message.to_dict() for message in messages]
+            if self._local_server is not None:
+                reply = await self._local_server._handle_local(payload, self.name)
+            elif self.transport == MCPTransportType.WEBSOCKET:
+                return await self._exchange_websocket(payload, [message.id for message in messages])
+            elif self.transport == MCPTransportType.HTTP:
+                reply = await self._send_http_payload(payload)
+            else:
+                raise ValueError(f"Unsupported transport type: {self.transport}")
+            
+            # A lone object instead of an array means the whole batch failed
+            if not isinstance(reply, list):
+                error = (reply or {}).get("error") or {}
+                raise Exception(f"MCP batch request failed: {error.get('message', 'Unknown error')}")
+            
+            return [MCPMessage.from_dict(data) for data in reply]
+            
+        except Exception as e:
+            logger.error(f"Error sending MCP batch: {e}")
+            raise
+    
+    def _ensure_reader(self) -> None:
+        """Start the WebSocket reader task if it is not running."""
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = asyncio.create_task(self._reader_loop(self.connection))
+    
+    async def _reader_loop(self, connection: Any) -> None:
+        """
+        Receive WebSocket replies and resolve the matching pending futures.
+        
+        Batch replies are routed entry by entry. When the connection fails or
+        the reader is cancelled, every pending call fails with ConnectionError.
+        """
+        error: BaseException = ConnectionError("MCP connection closed")
+        try:
+            while True:
+                raw = await connection.recv()
+                try:
+                    if self._msgpack_frames and not isinstance(raw, str):
+                        data = _serde.unpackb(raw)
+                    else:
+                        data = _serde.loads(raw)
+                except _serde.DECODE_ERRORS:
+                    logger.warning("Ignoring undecodable MCP reply")
+                    continue
+                
+                for reply_data in data if isinstance(data, list) else (data,):
+                    if not isinstance(reply_data, dict):
+                        continue
+                    reply = MCPMessage.from_dict(reply_data)
+                    if reply.id is None and reply.error:
+                        # Parse error or Invalid Request for a frame the server
+                        # could not read; it cannot be matched to a caller, so
+                        # fail every pending call instead of leaving it hanging
+                        self._fail_pending(Exception(
+                            f"MCP request rejected: {reply.error.get('message', 'Unknown error')}"
+                        ))
+                        continue
+                    future = self._pending.pop(reply.id, None)
+                    if future is None:
+                        logger.warning(f"Dropping MCP reply with unknown id: {reply.id}")
+                    elif not future.done():
+                        future.set_result(reply)
+                        
+        except asyncio.CancelledError:
+            error = ConnectionError("MCP client disconnected")
+            raise
+        except Exception as e:
+            error = ConnectionError(f"MCP connection lost: {e}")
+        finally:
+            self._fail_pending(error)
+    
+    def _fail_pending(self, error: BaseException) -> None:
+        """Fail every call waiting for a WebSocket reply."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+    
+    async def _exchange_websocket(self, payload: Any, message_ids: List[Any]) -> List[MCPMessage]:
+        """
+        Send JSON data via WebSocket and wait for the replies to the given ids.
+        
+        Any number of calls can be in flight on one connection; the reader
+        task hands each reply to the caller waiting for its id.
+        """
         if not self.connection:
             raise Exception("WebSocket connection not established")
         
-        message_str = json.dumps(message.to_dict())
-        await self.connection.send(message_str)
+        self._ensure_reader()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for message_id in message_ids:
+            future = loop.create_future()
+            self._pending[message_id] = future
+            futures.append(future)
         
-        response_str = await self.connection.recv()
-        response_data = json.loads(response_str)
-        
-        return MCPMessage.from_dict(response_data)
+        try:
+            if self._msgpack_frames:
+                await self.connection.send(_serde.packb(payload))
+            else:
+                await self.connection.send(_serde.dumps_str(payload))
+            return list(await asyncio.gather(*futures))
+        finally:
+            for message_id in message_ids:
+                self._pending.pop(message_id, None)
     
-    async def _send_http_message(self, message: MCPMessage) -> MCPMessage:
-        """Send message via HTTP."""
+    async def _send_http_payload(self, payload: Any) -> Any:
+        """Send JSON data via HTTP and return the decoded reply."""
         if not self.session:
             raise Exception("HTTP session not established")
         
-        async with self.session.post(self.server_url, json=message.to_dict()) as response:
-            response_data = await response.json()
-            return MCPMessage.from_dict(response_data)
+        async with self.session.post(
+            self.server_url,
+            data=_serde.dumps(payload),
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            return _serde.loads(await response.read())
     
-    async def call_tool(self, request: ToolCallRequest) -> ToolCallResponse:
-        """Call a tool on the remote MCP server."""
-        if not self.connected:
-            raise Exception("Not connected to MCP server")
-        
+    async def _send_websocket_message(self, message: MCPMessage) -> MCPMessage:
+        """Send message via WebSocket."""
+        replies = await self._exchange_websocket(message.to_dict(), [message.id])
+        return replies[0]
+    
+    async def _send_http_message(self, message: MCPMessage) -> MCPMessage:
+        """Send message via HTTP."""
+        return MCPMessage.from_dict(await self._send_http_payload(message.to_dict()))
+    
+    def _tool_call_message(self, request: ToolCallRequest) -> MCPMessage:
+        """Build the tools/call message for a request."""
         if request.name not in self.available_tools:
             raise ValueError(f"Tool '{request.name}' not available on MCP server")
         
-        message = MCPMessage(
-            id=str(uuid.uuid4()),
+        return MCPMessage(
+            id=next(self._next_id),
             method="tools/call",
             params={
                 "name": request.name,
                 "arguments": request.arguments
             }
         )
+    
+    def _to_tool_response(
+        self,
+        request: ToolCallRequest,
+        response: MCPMessage,
+        execution_time: float
+    ) -> ToolCallResponse:
+        """Convert a tools/call reply into a ToolCallResponse."""
+        if response.error:
+            return ToolCallResponse(
+                id=request.id,
+                name=request.name,
+                result=None,
+                success=False,
+                error=response.error.get("message", "Unknown error"),
+                execution_time=execution_time
+            )
+        
+        # Extract result from MCP response
+        result_content = response.result.get("content", [])
+        if result_content and len(result_content) > 0:
+            result = result_content[0].get("text", "")
+        else:
+            result = response.result
+        
+        is_error = response.result.get("isError", False)
+        
+        return ToolCallResponse(
+            id=request.id,
+            name=request.name,
+            result=result,
+            success=not is_error,
+            error=result if is_error else None,
+            execution_time=execution_time
+        )
+    
+    async def call_tool(self, request: ToolCallRequest) -> ToolCallResponse:
+        """Call a tool on the remote MCP server."""
+        if not self.connected:
+            raise Exception("Not connected to MCP server")
+        
+        message = self._tool_call_message(request)
         
         start_time = time.time()
         
@@ -657,33 +1192,7 @@ class MCPClient:
             response = await self._send_message(message)
             execution_time = time.time() - start_time
             
-            if response.error:
-                return ToolCallResponse(
-                    id=request.id,
-                    name=request.name,
-                    result=None,
-                    success=False,
-                    error=response.error.get("message", "Unknown error"),
-                    execution_time=execution_time
-                )
-            
-            # Extract result from MCP response
-            result_content = response.result.get("content", [])
-            if result_content and len(result_content) > 0:
-                result = result_content[0].get("text", "")
-            else:
-                result = response.result
-            
-            is_error = response.result.get("isError", False)
-            
-            return ToolCallResponse(
-                id=request.id,
-                name=request.name,
-                result=result,
-                success=not is_error,
-                error=result if is_error else None,
-                execution_time=execution_time
-            )
+            return self._to_tool_response(request, response, execution_time)
             
         except Exception as e:
             execution_time = time.time() - start_time
@@ -696,6 +1205,58 @@ class MCPClient:
                 execution_time=execution_time
             )
     
+    async def call_tools(self, requests: List[ToolCallRequest]) -> List[ToolCallResponse]:
+        """
+        Call several tools on the remote MCP server in one round trip.
+        
+        The calls are sent as a single JSON-RPC batch and the replies are
+        matched back to the requests by id.
+        
+        Args:
+            requests: Tool calls to make
+            
+        Returns:
+            One response per request, in request order
+        """
+        if not self.connected:
+            raise Exception("Not connected to MCP server")
+        
+        messages = [self._tool_call_message(request) for request in requests]
+        if not messages:
+            return []
+        
+        start_time = time.time()
+        
+        try:
+            replies = await self._send_batch(messages)
+            execution_time = time.time() - start_time
+            
+            replies_by_id = {reply.id: reply for reply in replies}
+            responses = []
+            for request, message in zip(requests, messages):
+                reply = replies_by_id.get(message.id)
+                if reply is None:
+                    reply = MCPMessage(
+                        id=message.id,
+                        error={"message": "No response received for request"}
+                    )
+                responses.append(self._to_tool_response(request, reply, execution_time))
+            return responses
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            return [
+                ToolCallResponse(
+                    id=request.id,
+                    name=request.name,
+                    result=None,
+                    success=False,
+                    error=str(e),
+                    execution_time=execution_time
+                )
+                for request in requests
+            ]
+    
     def get_available_tools(self) -> List[str]:
         """Get list of available tool names."""
         return list(self.available_tools.keys())
@@ -732,9 +1293,16 @@ class MCPClient:
             elif self.transport == MCPTransportType.HTTP and self.session:
                 await self.session.close()
             
+            if self._reader_task is not None:
+                self._reader_task.cancel()
+                await asyncio.gather(self._reader_task, return_exceptions=True)
+                self._reader_task = None
+            
             self.connected = False
             self.connection = None
             self.session = None
+            self._local_server = None
+            self._msgpack_frames = False
             
             logger.info(f"Disconnected from MCP server at {self.server_url}")
             
@@ -1,10 +1,14 @@
 import json
+import re
 from typing import List, Dict, Any, Optional
 from .base_tool import ToolCallRequest
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Matches JSON objects, allowing one level of nested braces
+_JSON_OBJECT_PATTERN = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.DOTALL)
+
 class ToolCallParser:
     """Parse tool calls from agent responses using JSON parsing."""
     
@@ -29,14 +33,7 @@ class ToolCallParser:
             pass
         
         # Use a simpler approach: find all JSON-like objects using regex
-        import re
-        
-        # Find all potential JSON objects starting with { and potentially ending with }
-        # This regex finds JSON objects that might span multiple lines
-        json_pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-        
-        # Find all matches
-        matches = re.finditer(json_pattern, response, re.DOTALL)
+        matches = _JSON_OBJECT_PATTERN.finditer(response)
         
         for match in matches:
             json_str = match.group()
@@ -2,18 +2,30 @@
 Collaboration tools for multi-agent systems.
 """
 
-import json
+import functools
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
+from ..core import _serde
 from ..core.tool import Tool
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _locked(method):
+    """Run a ProgressBoard method while holding the board lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class ProgressBoard(Tool):
     """
     Centralized communication board for multi-agent collaboration.
@@ -22,7 +34,7 @@ class ProgressBoard(Tool):
     Supports collaboration prompts and structured progress tracking.
     """
 
-    def __init__(self, board_file: str = "progress_board.json", workspace_dir: str = "."):
+    def __init__(self, board_file: str = "progress_board.json", workspace_dir: Union[str, Path] = "."):
         """
         Initialize the progress board.
 
@@ -32,9 +44,20 @@ class ProgressBoard(Tool):
         """
         self.workspace_dir = Path(workspace_dir)
         self.workspace_dir.mkdir(exist_ok=True)
+        # Resolved once; every load and save reuses this path
         self.board_file = self.workspace_dir / board_file
 
         self.collaboration_prompt = None
+        # Held across every load -> modify -> save so concurrent writers
+        # (agent batcher thread, event loop callers) never lose updates.
+        # Reentrant because batched and composite operations nest.
+        self._lock = threading.RLock()
+        # Per-thread in-memory board shared by all operations inside
+        # _shared_board(), so batches on a worker thread never capture
+        # reads or writes made from other threads
+        self._batch_state = threading.local()
+        # Last decoded board for get_board_data(), keyed by (mtime_ns, size)
+        self._snapshot: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
         self._ensure_board_exists()
 
         # Initialize the tool with multiple functions
@@ -60,7 +83,8 @@ class ProgressBoard(Tool):
             "report_progress": self.report_progress,
             "coordinate_with_team": self.coordinate_with_team,
             "share_code_snippet": self.share_code_snippet,
-            "get_recent_activity": self.get_recent_activity
+            "get_recent_activity": self.get_recent_activity,
+            "get_analysis_snapshot": self.get_analysis_snapshot
         }
 
     def _ensure_board_exists(self):
@@ -83,22 +107,125 @@ class ProgressBoard(Tool):
 
     def _load_board(self) -> Dict[str, Any]:
         """Load the current progress board state."""
+        batch_board = getattr(self._batch_state, "board", None)
+        if batch_board is not None:
+            return batch_board
         try:
-            with open(self.board_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.board_file, 'rb') as f:
+                return _serde.loads(f.read())
         except Exception as e:
             logger.error(f"Error loading progress board: {e}")
             return self._get_default_board()
 
     def _save_board(self, board_data: Dict[str, Any]):
         """Save the progress board state."""
+        if getattr(self._batch_state, "board", None) is not None:
+            # Written once when the enclosing batch finishes
+            return
+        self._snapshot = None
         try:
             board_data["last_updated"] = datetime.now().isoformat()
-            with open(self.board_file, 'w', encoding='utf-8') as f:
-                json.dump(board_data, f, indent=2, ensure_ascii=False)
+            # Replace the file in one step so readers never see a partial write
+            tmp_file = self.board_file.with_suffix(self.board_file.suffix + ".tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(_serde.dumps(board_data, indent=True))
+            os.replace(tmp_file, self.board_file)
         except Exception as e:
             logger.error(f"Error saving progress board: {e}")
 
+    @_locked
+    def get_board_data(self) -> Dict[str, Any]:
+        """
+        Get the full board contents for read-only use.
+
+        The decoded board is cached against the file's modification time and
+        size, so repeated reads of an unchanged board skip decoding. The
+        returned dict is shared between callers and must not be modified.
+
+        Returns:
+            Current progress board data
+        """
+        batch_board = getattr(self._batch_state, "board", None)
+        if batch_board is not None:
+            return batch_board
+        try:
+            stat = os.stat(self.board_file)
+        except OSError:
+            return self._load_board()
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == key:
+            return snapshot[1]
+
+        board = self._load_board()
+        self._snapshot = (key, board)
+        return board
+
+    @contextmanager
+    def _shared_board(self, save: bool):
+        """
+        Load the board once and serve every load/save inside the block from memory.
+
+        Args:
+            save: Whether to write the board back when the block exits
+        """
+        if getattr(self._batch_state, "board", None) is not None:
+            # Already inside a shared block; the outermost one owns the save
+            yield
+            return
+
+        self._batch_state.board = self._load_board()
+        try:
+            yield
+        finally:
+            board, self._batch_state.board = self._batch_state.board, None
+            if save:
+                self._save_board(board)
+
+    @_locked
+    def apply_batch(self, operations: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Apply several board operations with a single load and save.
+
+        Args:
+            operations: (function name, keyword arguments) pairs, where the
+                name is one of the registered board functions
+
+        Returns:
+            One result per operation, in order
+        """
+        results = []
+        with self._shared_board(save=True):
+            for operation, kwargs in operations:
+                try:
+                    results.append(self.functions[operation](**kwargs))
+                except Exception as e:
+                    logger.error(f"Error applying batched board operation {operation}: {e}")
+                    results.append({"success": False, "error": str(e)})
+
+        return results
+
+    @_locked
+    def get_analysis_snapshot(self, hours: int = 24) -> Dict[str, Any]:
+        """
+        Get project status, collaboration prompt and recent activity from one board read.
+
+        Args:
+            hours: Number of hours of activity to include
+
+        Returns:
+            The results of get_project_status, get_collaboration_prompt and
+            get_recent_activity under the keys project_status, prompt_info
+            and recent_activity
+        """
+        with self._shared_board(save=False):
+            return {
+                "project_status": self.get_project_status(),
+                "prompt_info": self.get_collaboration_prompt(),
+                "recent_activity": self.get_recent_activity(hours=hours)
+            }
+
     def _get_default_board(self) -> Dict[str, Any]:
         """Get default board structure."""
         return {
@@ -111,6 +238,7 @@ class ProgressBoard(Tool):
             "last_updated": datetime.now().isoformat()
         }
 
+    @_locked
     def set_collaboration_prompt(self, prompt: str) -> Dict[str, Any]:
         """
         Store the collaboration instructions for the project.
@@ -148,6 +276,7 @@ class ProgressBoard(Tool):
             "project_name": board["project"].get("name", "Unknown")
         }
 
+    @_locked
     def post_update(
         self,
         agent_name: str,
@@ -308,6 +437,7 @@ class ProgressBoard(Tool):
             "collaboration_prompt_set": board["project"].get("collaboration_prompt") is not None
         }
 
+    @_locked
     def share_interface(
         self,
         agent_name: str,
@@ -356,6 +486,7 @@ class ProgressBoard(Tool):
             "methods_count": len(methods)
         }
 
+    @_locked
     def request_help(
         self,
         agent_name: str,
@@ -411,6 +542,7 @@ class ProgressBoard(Tool):
             "status": "posted"
         }
 
+    @_locked
     def respond_to_help(
         self,
         agent_name: str,
@@ -470,6 +602,7 @@ class ProgressBoard(Tool):
             "response_count": len(help_request["responses"])
         }
 
+    @_locked
     def report_progress(
         self,
         agent_name: str,
@@ -582,12 +715,13 @@ class ProgressBoard(Tool):
             tags=["code", language, file_path] if file_path else ["code", language]
         )
 
-    def get_recent_activity(self, hours: int = 24) -> Dict[str, Any]:
+    def get_recent_activity(self, hours: int = 24, agent_filter: Optional[str] = None) -> Dict[str, Any]:
         """
         Get recent activity summary.
 
         Args:
             hours: Number of hours to look back
+            agent_filter: Only include activity from this agent
 
         Returns:
             Recent activity summary
@@ -601,7 +735,7 @@ class ProgressBoard(Tool):
         # Filter recent updates
         recent_updates = [
             u for u in board["updates"]
-            if u["timestamp"] > cutoff
+            if u["timestamp"] > cutoff and (agent_filter is None or u["agent"] == agent_filter)
         ]
 
         # Group by agent
@@ -621,7 +755,7 @@ class ProgressBoard(Tool):
         }
 
 
-def create_progress_board_tool(board_file: str = "progress_board.json", workspace_dir: str = ".") -> ProgressBoard:
+def create_progress_board_tool(board_file: str = "progress_board.json", workspace_dir: Union[str, Path] = ".") -> ProgressBoard:
     """
     Create a ProgressBoard tool instance.
 
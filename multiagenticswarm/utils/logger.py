@@ -46,7 +46,11 @@ class MultiAgenticSwarmLogger:
     def name(self) -> str:
         """Get the logger name."""
         return self.logger.name
-    
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a message of this level would be processed."""
+        return self.logger.isEnabledFor(level)
+
     # Standard logging methods for compatibility
     def info(self, message: str, extra: dict = None):
         """Log an info message."""
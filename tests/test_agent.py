@@ -6,7 +6,7 @@ import pytest
 import asyncio
 import json
 from unittest.mock import Mock, patch, AsyncMock
-from multiagenticswarm.core.agent import Agent, AgentConfig
+from multiagenticswarm.core.agent import Agent, AgentConfig, run_agents_parallel
 from multiagenticswarm.core.tool import Tool
 from multiagenticswarm.core.tool_executor import ToolExecutor
 from multiagenticswarm.core.base_tool import FunctionTool, ToolCallRequest
@@ -169,6 +169,22 @@ class TestAgentSerialization:
         assert restored_agent.max_iterations == original_agent.max_iterations
         assert restored_agent.memory_enabled == original_agent.memory_enabled
 
+    def test_bytes_roundtrip(self):
+        """Test binary serialization roundtrip."""
+        original_agent = Agent(
+            name="BytesAgent",
+            description="Test bytes",
+            llm_config={"temperature": 0.2},
+            agent_id="bytes-id-789"
+        )
+        original_agent.local_tools = ["tool_a"]
+
+        data = original_agent.to_bytes()
+        restored_agent = Agent.from_bytes(data)
+
+        assert isinstance(data, bytes)
+        assert restored_agent.to_dict() == original_agent.to_dict()
+
 
 class TestAgentMemory:
     """Test agent memory functionality."""
@@ -198,7 +214,20 @@ class TestAgentMemory:
         agent.add_to_memory("assistant", "Neither should this")
         
         assert len(agent.memory) == 0
-    
+
+    def test_memory_metadata_is_plain_dict(self):
+        """Test memory entries stay JSON-serializable and editable."""
+        agent = Agent(name="MetadataAgent", memory_enabled=True)
+        supplied = {}
+
+        agent.add_to_memory("user", "Hello")
+        agent.add_to_memory("assistant", "Hi", supplied)
+        agent.memory[0]["metadata"]["note"] = "added later"
+
+        assert agent.memory[1]["metadata"] is supplied
+        assert agent.memory[0]["metadata"] is not agent.memory[1]["metadata"]
+        assert json.loads(json.dumps(agent.memory))[0]["metadata"] == {"note": "added later"}
+
     def test_clear_memory(self):
         """Test clearing agent memory."""
         agent = Agent(name="ClearMemoryAgent", memory_enabled=True)
@@ -431,6 +460,24 @@ class TestAgentExecution:
         assert result["output"] == "Maximum tool calling iterations reached."
         assert result["tool_calls_made"] == 3  # Should match agent's max_iterations
 
+    @pytest.mark.asyncio
+    async def test_run_agents_parallel(self):
+        """Test running several agents concurrently with isolated contexts."""
+        with patch('multiagenticswarm.core.agent.get_llm_provider') as mock_get_provider:
+            mock_provider = AsyncMock()
+            mock_provider.execute.return_value = Mock(content="done", tool_calls=[])
+            mock_get_provider.return_value = mock_provider
+            
+            agents = [Agent(name=f"ParallelAgent{i}") for i in range(3)]
+            context = {"shared": True}
+            
+            results = await run_agents_parallel(agents, "Go", context=context, max_concurrency=2)
+            
+            assert [r["agent_name"] for r in results] == ["ParallelAgent0", "ParallelAgent1", "ParallelAgent2"]
+            assert all(r["success"] for r in results)
+            assert mock_provider.execute.call_count == 3
+            assert context == {"shared": True}
+
 
 class TestAgentLLMProvider:
     """Test agent LLM provider functionality."""
@@ -0,0 +1,414 @@
+"""
+Tests for progress board collaboration and UniversalAgent board writes.
+"""
+
+import asyncio
+import gc
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from multiagenticswarm.core._progress_batcher import _batchers, get_progress_batcher
+from multiagenticswarm.core.collaborative_system import CollaborativeSystem, UniversalAgent
+from multiagenticswarm.core.delegation import SimpleDelegator
+from multiagenticswarm.tools.collaboration_tools import ProgressBoard
+
+
+def make_agents(board, count):
+    """Create universal agents sharing one progress board."""
+    return [UniversalAgent(name=f"Agent{i}", progress_board=board) for i in range(count)]
+
+
+class PlainBoard:
+    """Board exposing only per-update functions, without apply_batch()."""
+
+    def __init__(self):
+        self.updates = []
+
+    def post_update(self, agent_name, message, **kwargs):
+        self.updates.append((agent_name, message))
+        return {"success": True, "timestamp": str(len(self.updates))}
+
+    def report_progress(self, agent_name, task, percentage, details, estimated_completion=None):
+        self.updates.append((agent_name, f"{task} {percentage}%"))
+        return {"success": True, "current_progress": percentage, "task": task}
+
+    def coordinate_with_team(self, agent_name, message, **kwargs):
+        return self.post_update(agent_name, message)
+
+
+class CountingBoard(ProgressBoard):
+    """Progress board that records the size of every batch it applies."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch_sizes = []
+        self.batch_threads = []
+
+    def apply_batch(self, operations):
+        self.batch_sizes.append(len(operations))
+        self.batch_threads.append(threading.current_thread())
+        return super().apply_batch(operations)
+
+
+class TestProgressBatcher:
+    """Test coalescing of progress board writes."""
+
+    @pytest.mark.asyncio
+    async def test_flush_keeps_submit_order(self, temp_dir):
+        """Operations queued in one window are applied in order, in one batch."""
+        board = CountingBoard(workspace_dir=temp_dir)
+        batcher = get_progress_batcher(board)
+
+        results = await asyncio.gather(*(
+            batcher.submit("post_update", agent_name="Agent", message=f"update {i}")
+            for i in range(10)
+        ))
+
+        assert all(result["success"] for result in results)
+        assert board.batch_sizes == [10]
+        messages = [u["message"] for u in board.get_board_data()["updates"]]
+        assert messages == [f"update {i}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped(self, temp_dir):
+        """A burst larger than max_batch_size is split across batches."""
+        board = CountingBoard(workspace_dir=temp_dir)
+        batcher = get_progress_batcher(board)
+
+        await asyncio.gather(*(
+            batcher.submit("post_update", agent_name="Agent", message=str(i))
+            for i in range(batcher.max_batch_size + 6)
+        ))
+
+        assert board.batch_sizes == [batcher.max_batch_size, 6]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_agent_submits_keep_every_entry(self, temp_dir):
+        """Every agent's reports are on the board after concurrent submits."""
+        board = CountingBoard(workspace_dir=temp_dir)
+        agents = make_agents(board, 8)
+
+        async def report(agent):
+            for step in range(5):
+                result = await agent.report_progress("work", step * 20, "working")
+                assert result["success"]
+
+        await asyncio.gather(*(report(agent) for agent in agents))
+
+        reports = board.get_board_data()["progress_reports"]
+        assert len(reports) == 40
+        for agent in agents:
+            steps = [r["percentage"] for r in reports if r["agent"] == agent.name]
+            assert steps == [0, 20, 40, 60, 80]
+        assert len(board.batch_sizes) < 40
+
+    @pytest.mark.asyncio
+    async def test_board_without_apply_batch(self):
+        """Boards without apply_batch() are called directly, off the loop."""
+        board = PlainBoard()
+        agent = UniversalAgent(name="Reporter", progress_board=board)
+
+        result = await agent.report_progress("build", 50, "halfway")
+
+        assert result["success"]
+        assert board.updates == [("Reporter", "build 50%")]
+
+    def test_batcher_dropped_with_board(self, temp_dir):
+        """The shared batcher does not keep its board alive."""
+        board = ProgressBoard(workspace_dir=temp_dir)
+        batcher = get_progress_batcher(board)
+        assert get_progress_batcher(board) is batcher
+
+        del board
+        gc.collect()
+
+        assert batcher._board_ref() is None
+        assert batcher not in _batchers.values()
+
+
+class TestProgressBoardConcurrency:
+    """Test concurrent writers on one progress board."""
+
+    @pytest.mark.asyncio
+    async def test_no_lost_updates_with_concurrent_writers(self, temp_dir):
+        """Batched agent writes and loop-thread writes must all be kept."""
+        board = ProgressBoard(workspace_dir=temp_dir)
+        agents = make_agents(board, 10)
+
+        async def report(agent):
+            for step in range(20):
+                await agent.report_progress(f"task-{agent.name}", step, "working")
+
+        async def set_prompts():
+            for i in range(20):
+                board.set_collaboration_prompt(f"prompt {i}")
+                await asyncio.sleep(0)
+
+        def direct_batches():
+            for i in range(20):
+                board.apply_batch([
+                    ("post_update", {"agent_name": "Direct", "message": f"direct {i}"})
+                ])
+
+        thread = threading.Thread(target=direct_batches)
+        thread.start()
+        await asyncio.gather(set_prompts(), *(report(agent) for agent in agents))
+        thread.join()
+
+        data = board.get_board_data()
+        assert len(data["progress_reports"]) == 200
+        assert sum(1 for u in data["updates"] if u["agent"] == "Direct") == 20
+        assert data["project"]["collaboration_prompt"] == "prompt 19"
+
+
+class TestCollaborativeSystemBoardWrites:
+    """Test CollaborativeSystem writes sharing the agents' batcher."""
+
+    @pytest.mark.asyncio
+    async def test_prompt_delegation_alongside_agent_reports(self, temp_dir):
+        """Prompt-based delegation keeps agents' in-flight reports."""
+        system = CollaborativeSystem(workspace_dir=temp_dir, enable_logging=False)
+        agents = make_agents(system.progress_board, 5)
+        system.add_agents(agents)
+
+        async def report(agent):
+            for step in range(10):
+                await agent.report_progress("work", step, "working")
+
+        delegation, *_ = await asyncio.gather(
+            system.delegate_tasks_from_prompt("Build app", "Agent0 handles UI"),
+            *(report(agent) for agent in agents)
+        )
+
+        data = system.progress_board.get_board_data()
+        assert delegation["strategy"] == "prompt-based"
+        assert len(data["progress_reports"]) == 50
+        assert data["project"]["collaboration_prompt"] == "Agent0 handles UI"
+        assert sum(1 for u in data["updates"] if u.get("task") == "task_delegation") == 1
+
+    def test_progress_events_reach_wait_for_progress(self, temp_dir):
+        """Progress reports are delivered to waiters on each running loop."""
+        # Built outside any event loop, as scripts do before asyncio.run()
+        system = CollaborativeSystem(workspace_dir=temp_dir, enable_logging=False)
+        agent = UniversalAgent(name="Reporter")
+        system.add_agent(agent)
+
+        async def report_and_wait(percentage):
+            waiter = asyncio.ensure_future(system.wait_for_progress())
+            await agent.report_progress("build", percentage, "working")
+            return await asyncio.wait_for(waiter, timeout=5)
+
+        assert asyncio.run(report_and_wait(10)) == {"agent": "Reporter", "task": "build", "percentage": 10}
+        assert asyncio.run(report_and_wait(20))["percentage"] == 20
+
+    def test_flutter_structure_is_plain_data(self, temp_dir):
+        """The generated project structure can be encoded and edited by callers."""
+        system = CollaborativeSystem(workspace_dir=temp_dir, enable_logging=False)
+
+        first = system._generate_flutter_structure({})
+        first["flutter_music_app/"]["lib/"]["extra.dart"] = "added"
+        second = system._generate_flutter_structure({})
+
+        assert json.loads(json.dumps(second)) == second
+        assert "extra.dart" not in second["flutter_music_app/"]["lib/"]
+        assert second["summary"]["total_files"] == first["summary"]["total_files"]
+
+    @pytest.mark.asyncio
+    async def test_compile_deliverables_reads_board_off_loop(self, temp_dir):
+        """compile_deliverables() never reads the locked board on the loop thread."""
+        system = CollaborativeSystem(workspace_dir=temp_dir, enable_logging=False)
+        board = system.progress_board
+        read_threads = []
+        get_board_data = board.get_board_data
+
+        def recording_get_board_data():
+            read_threads.append(threading.current_thread())
+            return get_board_data()
+
+        with patch.object(board, "get_board_data", recording_get_board_data):
+            deliverables = await system.compile_deliverables()
+
+        assert "project_structure" in deliverables
+        assert read_threads and threading.main_thread() not in read_threads
+
+    def test_uvloop_is_opt_in(self, temp_dir):
+        """The event loop policy is only changed when asked for."""
+        with patch("multiagenticswarm.core._loop.install_uvloop") as install:
+            CollaborativeSystem(workspace_dir=temp_dir, enable_logging=False)
+            install.assert_not_called()
+            CollaborativeSystem(workspace_dir=temp_dir, enable_logging=False, use_uvloop=True)
+            install.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_phase_execution_leaves_task_factory_alone(self, temp_dir):
+        """Running phases does not change the caller's loop task factory."""
+        system = CollaborativeSystem(workspace_dir=temp_dir, enable_logging=False)
+        system.add_agents(make_agents(system.progress_board, 2))
+        loop = asyncio.get_running_loop()
+        factory = loop.get_task_factory()
+
+        for phase_type in ("parallel", "collaborative"):
+            results = await system.execute_collaboration_phase(
+                {"name": "Build", "type": phase_type, "agents": ["Agent0", "Agent1"]}, "task"
+            )
+            assert set(results) == {"Agent0", "Agent1"}
+
+        assert loop.get_task_factory() is factory
+
+
+class TestDelegationBoardWrites:
+    """Test delegation posting to progress boards."""
+
+    @pytest.mark.asyncio
+    async def test_autonomous_delegation_posts_batch(self, temp_dir):
+        """All delegation updates reach a real board."""
+        board = ProgressBoard(workspace_dir=temp_dir)
+        delegator = SimpleDelegator("autonomous", "", board)
+
+        await delegator.delegate_task("Build app", ["UIAgent", "AudioAgent"])
+
+        updates = board.get_board_data()["updates"]
+        assert len(updates) == 5
+        assert updates[0]["agent"] == "SimpleDelegator"
+
+    @pytest.mark.asyncio
+    async def test_collaborative_delegation_writes_off_loop(self, temp_dir):
+        """Delegation batches are applied on the board's worker thread."""
+        board = CountingBoard(workspace_dir=temp_dir)
+        delegator = SimpleDelegator("collaborative", "", board)
+
+        await delegator.delegate_task("Build app", ["UIAgent", "AudioAgent"])
+
+        assert board.batch_sizes
+        assert threading.main_thread() not in board.batch_threads
+
+    @pytest.mark.asyncio
+    async def test_delegation_without_apply_batch(self):
+        """Boards without apply_batch() receive updates one at a time."""
+        board = PlainBoard()
+        delegator = SimpleDelegator("collaborative", "", board)
+
+        plan = await delegator.delegate_task("Build app", ["UIAgent", "AudioAgent"])
+
+        first_round = plan["negotiation_rounds"][0]["negotiations"]
+        assert [n["timestamp"] for n in first_round] == ["3", "4"]
+        assert board.updates[0][0] == "SimpleDelegator"
+
+
+class PhaseRecorder:
+    """Stand-in for execute_collaboration_phase() that records when phases run."""
+
+    def __init__(self):
+        self.events = []
+        self.durations = {}
+        self.failing = set()
+
+    async def __call__(self, phase, main_task):
+        name = phase["name"]
+        self.events.append(("start", name))
+        try:
+            await asyncio.sleep(self.durations.get(name, 0.01))
+        except asyncio.CancelledError:
+            self.events.append(("cancelled", name))
+            raise
+        if name in self.failing:
+            raise RuntimeError(f"{name} failed")
+        self.events.append(("end", name))
+        return {"phase": name}
+
+
+class TestCollaborationPhaseScheduling:
+    """Test dependency-ordered execution of collaboration phases."""
+
+    @pytest.fixture
+    def system(self, temp_dir):
+        """Collaborative system whose phases only record when they run."""
+        system = CollaborativeSystem(workspace_dir=temp_dir, enable_logging=False)
+        system.execute_collaboration_phase = PhaseRecorder()
+        return system
+
+    @pytest.mark.asyncio
+    async def test_independent_phases_overlap(self, system):
+        """Phases without dependencies on each other run at the same time."""
+        recorder = system.execute_collaboration_phase
+        phases = [
+            {"name": "A", "depends_on": []},
+            {"name": "B", "depends_on": []},
+        ]
+
+        results = await system.execute_collaboration_phases(phases, "task")
+
+        assert results == {"A": {"phase": "A"}, "B": {"phase": "B"}}
+        assert recorder.events[:2] == [("start", "A"), ("start", "B")]
+
+    @pytest.mark.asyncio
+    async def test_phases_without_depends_on_run_in_order(self, system):
+        """Plain phase lists still run one after another."""
+        recorder = system.execute_collaboration_phase
+
+        await system.execute_collaboration_phases([{"name": "A"}, {"name": "B"}], "task")
+
+        assert recorder.events == [("start", "A"), ("end", "A"), ("start", "B"), ("end", "B")]
+
+    @pytest.mark.asyncio
+    async def test_integration_waits_for_earlier_phases(self, system):
+        """Default phases 1-3 overlap and phase 4 starts after all of them."""
+        recorder = system.execute_collaboration_phase
+        phases = system._create_default_phases({
+            "DataAgent": {"primary_focus": "data"},
+            "AudioAgent": {"primary_focus": "audio"},
+            "UIAgent": {"primary_focus": "ui"},
+        })
+        names = [phase["name"] for phase in phases]
+        recorder.durations = {names[0]: 0.05, names[1]: 0.01, names[2]: 0.03}
+
+        results = await system.execute_collaboration_phases(phases, "task")
+
+        assert list(results) == names
+        assert recorder.events[:3] == [("start", name) for name in names[:3]]
+        integration_start = recorder.events.index(("start", names[3]))
+        for name in names[:3]:
+            assert recorder.events.index(("end", name)) < integration_start
+
+    @pytest.mark.parametrize("phases, message", [
+        ([{"name": "A", "depends_on": ["Missing"]}], "unknown phase"),
+        ([{"name": "A", "depends_on": ["B"]}, {"name": "B", "depends_on": ["A"]}], "cycle"),
+        ([{"name": "A"}, {"name": "A"}, {"name": "B", "depends_on": ["A"]}], "duplicate"),
+    ])
+    @pytest.mark.asyncio
+    async def test_invalid_dependencies_raise(self, system, phases, message):
+        """Unknown, cyclic or ambiguous dependencies are rejected up front."""
+        with pytest.raises(ValueError, match=message):
+            await system.execute_collaboration_phases(phases, "task")
+        assert system.execute_collaboration_phase.events == []
+
+    @pytest.mark.asyncio
+    async def test_duplicate_names_without_references(self, system):
+        """Phases may share a name as long as nothing depends on it."""
+        phases = [{"name": "Review"}, {"name": "Review"}]
+
+        results = await system.execute_collaboration_phases(phases, "task")
+
+        assert results == {"Review": {"phase": "Review"}, "phase_1": {"phase": "Review"}}
+
+    @pytest.mark.asyncio
+    async def test_failing_phase_cancels_the_rest(self, system):
+        """A failed phase cancels running phases and never starts dependents."""
+        recorder = system.execute_collaboration_phase
+        phases = [
+            {"name": "Fails", "depends_on": []},
+            {"name": "Slow", "depends_on": []},
+            {"name": "After", "depends_on": ["Fails"]},
+        ]
+        recorder.failing = {"Fails"}
+        recorder.durations = {"Slow": 5}
+
+        with pytest.raises(RuntimeError, match="Fails failed"):
+            await system.execute_collaboration_phases(phases, "task")
+        await asyncio.sleep(0)
+
+        assert ("cancelled", "Slow") in recorder.events
+        assert ("start", "After") not in recorder.events
@@ -45,6 +45,30 @@ class TestTool(BaseTool):
         return f"Processed: {message}"
 
 
+class QueueConnection:
+    """In-memory stand-in for a client WebSocket connection."""
+    
+    def __init__(self):
+        self.sent = []
+        self.incoming = asyncio.Queue()
+    
+    def push(self, reply):
+        """Queue a reply, or an exception to raise from recv()."""
+        self.incoming.put_nowait(reply if isinstance(reply, Exception) else json.dumps(reply))
+    
+    async def send(self, data):
+        self.sent.append(data)
+    
+    async def recv(self):
+        reply = await self.incoming.get()
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+    
+    async def close(self):
+        pass
+
+
 class TestMCPMessage:
     """Test MCPMessage class."""
     
@@ -203,7 +227,21 @@ class TestMCPServer:
         assert len(result["tools"]) == 1
         assert result["tools"][0]["name"] == "test_tool"
         assert result["tools"][0]["description"] == "A test tool for MCP integration"
-    
+
+    @pytest.mark.asyncio
+    async def test_handle_tools_list_tracks_changes(self):
+        """Test that the cached tools/list result follows expose/remove."""
+        server = MCPServer()
+        server.expose_tool(TestTool("tool_a").set_global())
+
+        assert [t["name"] for t in (await server.handle_tools_list({}))["tools"]] == ["tool_a"]
+
+        server.expose_tool(TestTool("tool_b").set_global())
+        assert [t["name"] for t in (await server.handle_tools_list({}))["tools"]] == ["tool_a", "tool_b"]
+
+        server.remove_tool("tool_a")
+        assert [t["name"] for t in (await server.handle_tools_list({}))["tools"]] == ["tool_b"]
+
     @pytest.mark.asyncio
     async def test_handle_tools_call(self):
         """Test handling tools/call request."""
@@ -223,6 +261,33 @@ class TestMCPServer:
         assert result["isError"] is False
         assert "Processed: test message" in result["content"][0]["text"]
     
+    @pytest.mark.asyncio
+    async def test_handle_tools_call_concurrency_limit(self):
+        """Test that tool executions are bounded by max_concurrent_tool_calls."""
+        running = 0
+        peak = 0
+
+        class SlowTool(TestTool):
+            async def _execute_impl(self, message: str = "Hello") -> str:
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return message
+
+        server = MCPServer()
+        server.max_concurrent_tool_calls = 2
+        server.expose_tool(SlowTool("slow_tool").set_global())
+
+        results = await asyncio.gather(*(
+            server.handle_tools_call({"name": "slow_tool", "arguments": {"message": str(i)}})
+            for i in range(6)
+        ))
+
+        assert peak == 2
+        assert [result["content"][0]["text"] for result in results] == [str(i) for i in range(6)]
+    
     @pytest.mark.asyncio
     async def test_handle_tools_call_unknown_tool(self):
         """Test handling tools/call request for unknown tool."""
@@ -239,6 +304,28 @@ class TestMCPServer:
         assert result["isError"] is True
         assert "not found" in result["content"][0]["text"]
     
+    @pytest.mark.asyncio
+    async def test_tools_call_invalid_params(self):
+        """Test that arguments failing the inputSchema are rejected up front."""
+        pytest.importorskip("fastjsonschema")
+        server = MCPServer()
+        tool = TestTool("test_tool")
+        tool.set_global()
+        server.expose_tool(tool)
+        
+        message = MCPMessage(
+            id="call-1",
+            method="tools/call",
+            params={"name": "test_tool", "arguments": {"message": 42}}
+        )
+        response = await server.handle_message(message, "test-client")
+        
+        assert response.result is None
+        assert response.error["code"] == -32602
+        
+        server.remove_tool("test_tool")
+        assert server.validate_tool_arguments(message.params) is None
+    
     def test_get_status(self):
         """Test getting server status."""
         server = MCPServer(name="test-server", host="localhost", port=8765)
@@ -255,6 +342,50 @@ class TestMCPServer:
         assert status["exposed_tools"] == 1
         assert status["connected_clients"] == 0
 
+    @pytest.mark.asyncio
+    async def test_websocket_client_dispatch(self):
+        """Test that WebSocket requests are answered through the writer task."""
+        server = MCPServer()
+        tool = TestTool("test_tool")
+        tool.set_global()
+        server.expose_tool(tool)
+
+        requests = [
+            json.dumps({"jsonrpc": "2.0", "id": "1", "method": "tools/list"}),
+            "not json",
+            json.dumps({
+                "jsonrpc": "2.0", "id": "2", "method": "tools/call",
+                "params": {"name": "test_tool", "arguments": {"message": "hi"}}
+            })
+        ]
+
+        class FakeWebSocket:
+            def __init__(self):
+                self.sent = []
+                self.all_sent = asyncio.Event()
+
+            async def send(self, data):
+                self.sent.append(data)
+                if len(self.sent) == len(requests):
+                    self.all_sent.set()
+
+            async def __aiter__(self):
+                for request in requests:
+                    yield request
+                # Stay connected until every response has gone out
+                await self.all_sent.wait()
+
+        websocket = FakeWebSocket()
+        await asyncio.wait_for(server._handle_websocket_client(websocket), timeout=5)
+
+        responses = [json.loads(data) for data in websocket.sent]
+        assert all(isinstance(data, str) for data in websocket.sent)
+        by_id = {response.get("id"): response for response in responses}
+        assert by_id[None]["error"]["code"] == -32700
+        assert by_id["1"]["result"]["tools"][0]["name"] == "test_tool"
+        assert "Processed: hi" in by_id["2"]["result"]["content"][0]["text"]
+        assert server.clients == {}
+
 
 class TestMCPClient:
     """Test MCPClient class."""
@@ -273,6 +404,16 @@ class TestMCPClient:
         assert not client.connected
         assert len(client.available_tools) == 0
     
+    def test_uvloop_is_opt_in(self):
+        """Test that servers and clients only change the loop policy when asked."""
+        with patch("multiagenticswarm.core._loop.install_uvloop") as install:
+            MCPServer()
+            MCPClient("ws://localhost:8765")
+            install.assert_not_called()
+            MCPServer(use_uvloop=True)
+            MCPClient("ws://localhost:8765", use_uvloop=True)
+            assert install.call_count == 2
+    
     def test_get_available_tools(self):
         """Test getting available tool names."""
         client = MCPClient("ws://localhost:8765")
@@ -326,6 +467,241 @@ class TestMCPClient:
         assert status["connected"] is False
         assert status["available_tools"] == 1
 
+    @pytest.mark.asyncio
+    async def test_send_websocket_message(self):
+        """Test that concurrent WebSocket calls get their own replies."""
+        client = MCPClient("ws://localhost:8765")
+        client.connection = QueueConnection()
+        client.connected = True
+
+        calls = asyncio.gather(
+            client._send_websocket_message(MCPMessage(id=1, method="tools/list")),
+            client._send_websocket_message(MCPMessage(id=2, method="tools/list"))
+        )
+        while len(client.connection.sent) < 2:
+            await asyncio.sleep(0)
+
+        sent = client.connection.sent
+        assert all(isinstance(data, str) for data in sent)
+        assert json.loads(sent[0]) == {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+
+        # Replies arrive out of order and are routed by id
+        client.connection.push({"jsonrpc": "2.0", "id": 2, "result": {"call": 2}})
+        client.connection.push({"jsonrpc": "2.0", "id": 1, "result": {"call": 1}})
+        first, second = await asyncio.wait_for(calls, timeout=5)
+
+        assert first.result == {"call": 1}
+        assert second.result == {"call": 2}
+        await client.disconnect()
+        assert client._reader_task is None
+
+    @pytest.mark.asyncio
+    async def test_send_websocket_message_connection_lost(self):
+        """Test that pending calls fail when the connection drops."""
+        client = MCPClient("ws://localhost:8765")
+        client.connection = QueueConnection()
+
+        call = asyncio.ensure_future(
+            client._send_websocket_message(MCPMessage(id=1, method="tools/list"))
+        )
+        while not client.connection.sent:
+            await asyncio.sleep(0)
+        client.connection.push(ConnectionResetError("reset"))
+
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(call, timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_send_websocket_message_rejected_frame(self):
+        """Test that an error reply without an id fails the waiting call."""
+        client = MCPClient("ws://localhost:8765")
+        client.connection = QueueConnection()
+        client.connected = True
+        client.available_tools = {"test_tool": {"name": "test_tool"}}
+
+        call = asyncio.ensure_future(client.call_tool(
+            ToolCallRequest(id="a", name="test_tool", arguments={"message": "hi"})
+        ))
+        while not client.connection.sent and not call.done():
+            await asyncio.sleep(0)
+        client.connection.push({"jsonrpc": "2.0", "error": {"code": -32700, "message": "Parse error"}})
+
+        response = await asyncio.wait_for(call, timeout=5)
+        assert not response.success
+        assert "Parse error" in response.error
+        assert client._pending == {}
+        await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_call_tools_batch(self):
+        """Test that several tool calls share one JSON-RPC batch round trip."""
+        server = MCPServer()
+        server.expose_tool(TestTool("test_tool").set_global())
+
+        class ServerConnection(QueueConnection):
+            """Hands each sent frame straight to the server."""
+            async def send(self, data):
+                await super().send(data)
+                replies = await server.handle_batch(json.loads(data), "test-client")
+                # Reverse to check that replies are matched by id, not position
+                self.push([reply.to_dict() for reply in reversed(replies)])
+
+        client = MCPClient("ws://localhost:8765")
+        client.connection = ServerConnection()
+        client.connected = True
+        client.available_tools = {"test_tool": {"name": "test_tool"}}
+
+        responses = await client.call_tools([
+            ToolCallRequest(id="a", name="test_tool", arguments={"message": "one"}),
+            ToolCallRequest(id="b", name="test_tool", arguments={"message": "two"})
+        ])
+
+        assert len(client.connection.sent) == 1
+        assert [response.id for response in responses] == ["a", "b"]
+        assert all(response.success for response in responses)
+        assert responses[0].result == "Processed: one"
+        assert responses[1].result == "Processed: two"
+        await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_in_process_server_short_circuit(self):
+        """Test that a client pointed at a server in this process calls it directly."""
+        server = MCPServer(name="local-server", host="localhost", port=18765)
+        server.expose_tool(TestTool("test_tool").set_global())
+        with patch.object(server, "start_websocket_server", AsyncMock()):
+            await server.start()
+
+        try:
+            client = MCPClient("ws://localhost:18765")
+            await client.connect()
+
+            assert client.connection is None
+            assert client.server_info["name"] == "local-server"
+            assert client.get_available_tools() == ["test_tool"]
+
+            response = await client.call_tool(
+                ToolCallRequest(id="a", name="test_tool", arguments={"message": "local"})
+            )
+            assert response.success
+            assert response.result == "Processed: local"
+
+            await client.disconnect()
+            assert client._local_server is None
+        finally:
+            await server.stop()
+
+        assert "localhost:18765" not in MCPServer._local_registry
+
+    @pytest.mark.asyncio
+    async def test_in_process_server_returns_copies(self):
+        """Test that the direct path never hands the server's cached dicts to the client."""
+        server = MCPServer(name="local-server", host="localhost", port=18766)
+        tool = TestTool("test_tool").set_global()
+        server.expose_tool(tool)
+        with patch.object(server, "start_websocket_server", AsyncMock()):
+            await server.start()
+
+        try:
+            client = MCPClient("ws://localhost:18766")
+            await client.connect()
+
+            client.server_info["name"] = "changed"
+            client.available_tools["test_tool"]["inputSchema"]["required"].append("extra")
+            client.available_tools.clear()
+
+            assert (await server.handle_initialize({}))["serverInfo"]["name"] == "local-server"
+            assert (await server.handle_tools_list({}))["tools"][0]["name"] == "test_tool"
+            assert tool.parameters["required"] == ["message"]
+            await client.disconnect()
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_in_process_server_opt_out(self):
+        """Test that use_local_server=False always goes through the transport."""
+        server = MCPServer(host="localhost", port=18767)
+        with patch.object(server, "start_websocket_server", AsyncMock()):
+            await server.start()
+
+        try:
+            client = MCPClient("ws://localhost:18767")
+            client.use_local_server = False
+            assert client._find_local_server() is None
+            client.use_local_server = True
+            assert client._find_local_server() is server
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_unix_socket_server_not_used_for_tcp_url(self):
+        """Test that a Unix socket server is never reached through its host:port."""
+        server = MCPServer(host="localhost", port=18768)
+        server.unix_socket_path = "/tmp/mcp-test.sock"
+        with patch.object(server, "start_websocket_server", AsyncMock()):
+            await server.start()
+
+        try:
+            assert "localhost:18768" not in MCPServer._local_registry
+            client = MCPClient("ws://localhost:18768")
+            with patch.object(client, "_connect_websocket", AsyncMock(side_effect=ConnectionRefusedError)):
+                with pytest.raises(ConnectionRefusedError):
+                    await client.connect()
+            assert client._local_server is None
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_msgpack_frames_negotiation(self):
+        """Test that MessagePack frames are used only when both ends support them."""
+        from multiagenticswarm.core import _serde
+
+        server = MCPServer()
+        server.expose_tool(TestTool("test_tool").set_global())
+        to_server, to_client = asyncio.Queue(), asyncio.Queue()
+
+        class ServerSocket:
+            async def send(self, data):
+                to_client.put_nowait(data)
+
+            async def __aiter__(self):
+                while (frame := await to_server.get()) is not None:
+                    yield frame
+
+        class ClientSocket:
+            def __init__(self):
+                self.sent = []
+
+            async def send(self, data):
+                self.sent.append(data)
+                to_server.put_nowait(data)
+
+            async def recv(self):
+                return await to_client.get()
+
+            async def close(self):
+                to_server.put_nowait(None)
+
+        serving = asyncio.ensure_future(server._handle_websocket_client(ServerSocket()))
+        client = MCPClient("ws://localhost:8765")
+        client.prefer_msgpack = True
+        client.connection = ClientSocket()
+
+        await client._initialize()
+        await client._discover_tools()
+        client.connected = True
+        response = await client.call_tool(
+            ToolCallRequest(id="a", name="test_tool", arguments={"message": "packed"})
+        )
+
+        assert response.result == "Processed: packed"
+        # The initialize request always goes out as JSON text
+        assert isinstance(client.connection.sent[0], str)
+        later_frames_binary = {isinstance(frame, bytes) for frame in client.connection.sent[1:]}
+        assert later_frames_binary == {_serde.MSGSPEC_AVAILABLE}
+
+        await client.disconnect()
+        await asyncio.wait_for(serving, timeout=5)
+
 
 class TestMCPTool:
     """Test MCPTool class."""